@@ -1,89 +1,181 @@
 """The Berbel integration."""
 from __future__ import annotations
 
+import asyncio
+import importlib
 import logging
-from typing import Any
+import time
+from typing import Any, Final
 
 import voluptuous as vol
 from bleak.backends.device import BLEDevice
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import ConfigType
 
 from .coordinator import BerbelDataUpdateCoordinator
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.FAN, Platform.LIGHT, Platform.BINARY_SENSOR]
+PLATFORMS: Final[tuple[Platform, ...]] = (Platform.FAN, Platform.LIGHT, Platform.BINARY_SENSOR)
+
+# Window in which repeated set_immediate_refresh calls are coalesced (seconds)
+IMMEDIATE_REFRESH_DEBOUNCE = 0.1
+
+# How old a status read by the config flow may be to seed the coordinator (seconds)
+INITIAL_DATA_MAX_AGE = 60.0
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 # Service schemas
-SERVICE_SET_IMMEDIATE_REFRESH_SCHEMA = vol.Schema({
+SERVICE_SET_IMMEDIATE_REFRESH_SCHEMA: Final = vol.Schema({
     vol.Required("enabled"): cv.boolean,
 })
 
 
+def _import_platforms() -> None:
+    """Import the platform modules (runs in the executor)."""
+    for platform in PLATFORMS:
+        importlib.import_module(f"{__name__}.{platform.value}")
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the shared Berbel domain data."""
+    # The config flow may already have stored data (see _initial_devices)
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data.update({
+        "_coordinators": set(),
+        "_services_registered": False,
+        "_immediate_refresh_unsub": None,
+    })
+    domain_data.setdefault("_initial_devices", {})
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Berbel from a config entry."""
     address = entry.data[CONF_ADDRESS]
     
     # Get the Bluetooth device
-    ble_device = bluetooth.async_ble_device_from_address(hass, address.upper(), True)
+    ble_device = bluetooth.async_ble_device_from_address(hass, address, True)
     if not ble_device:
+        # Do not block setup waiting for the hood: HA retries the entry, and a
+        # bluetooth discovery of the address schedules a reload of an entry
+        # in setup retry (see the config flow's unique ID check)
         raise ConfigEntryNotReady(
             f"Could not find Berbel device with address {address}"
         )
 
+    # Reuse the status the config flow just read, if it is recent enough
+    initial_data = None
+    if seed := hass.data[DOMAIN]["_initial_devices"].pop(address, None):
+        if time.monotonic() - seed[0] < INITIAL_DATA_MAX_AGE:
+            initial_data = seed[1]
+
     # Create the coordinator
     coordinator = BerbelDataUpdateCoordinator(
-        hass, ble_device, entry.title or "Berbel"
+        hass, ble_device, entry.title, initial_data, address=address
+    )
+
+    @callback
+    def _async_update_ble_device(
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Keep the coordinator's BLEDevice current from advertisements."""
+        coordinator.ble_device = service_info.device
+
+    entry.async_on_unload(
+        bluetooth.async_register_callback(
+            hass,
+            _async_update_ble_device,
+            bluetooth.BluetoothCallbackMatcher(address=address, connectable=True),
+            bluetooth.BluetoothScanningMode.PASSIVE,
+        )
     )
 
-    # Fetch initial data so we have data when entities subscribe
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch initial data so we have data when entities subscribe (unless the
+    # coordinator was seeded). The platform modules are imported in parallel;
+    # forwarding itself still waits for the refresh because the entities read
+    # coordinator.data when they are added.
+    if coordinator.data is None:
+        await asyncio.gather(
+            coordinator.async_config_entry_first_refresh(),
+            hass.async_add_executor_job(_import_platforms),
+        )
+    else:
+        await hass.async_add_executor_job(_import_platforms)
 
     # Store the coordinator
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entry.runtime_data = coordinator
+    domain_data = hass.data[DOMAIN]
+    domain_data["_coordinators"].add(coordinator)
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services
+    # Register services. All handlers close over domain_data (the dict lives
+    # as long as hass) instead of looking up hass.data[DOMAIN] per call.
+    @callback
+    def _apply_pending_immediate_refresh(_now: Any) -> None:
+        """Apply the last requested immediate refresh setting to all coordinators."""
+        domain_data["_immediate_refresh_unsub"] = None
+        enabled = domain_data.pop("_pending_immediate_refresh")
+        for coordinator in domain_data["_coordinators"]:
+            coordinator.set_immediate_refresh(enabled)
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Set immediate refresh to %s for all Berbel devices", enabled)
+
     async def handle_set_immediate_refresh(call: ServiceCall) -> None:
         """Handle set_immediate_refresh service call."""
-        enabled = call.data["enabled"]
-        # Apply to all coordinators
-        for coordinator in hass.data[DOMAIN].values():
-            if isinstance(coordinator, BerbelDataUpdateCoordinator):
-                coordinator.set_immediate_refresh(enabled)
-        _LOGGER.info("Set immediate refresh to %s for all Berbel devices", enabled)
+        # Only the last value within the debounce window is applied
+        domain_data["_pending_immediate_refresh"] = call.data["enabled"]
+        if domain_data["_immediate_refresh_unsub"] is None:
+            domain_data["_immediate_refresh_unsub"] = async_call_later(
+                hass, IMMEDIATE_REFRESH_DEBOUNCE, _apply_pending_immediate_refresh
+            )
 
     async def handle_disconnect_ble(call: ServiceCall) -> None:
         """Handle disconnect_ble service call."""
-        # Disconnect all coordinators
-        for coordinator in hass.data[DOMAIN].values():
-            if isinstance(coordinator, BerbelDataUpdateCoordinator):
-                await coordinator.client.disconnect()
-        _LOGGER.info("Disconnected BLE for all Berbel devices")
+        # Disconnect all coordinators concurrently
+        coordinators = list(domain_data["_coordinators"])
+        results = await asyncio.gather(
+            *(coordinator.client.disconnect() for coordinator in coordinators),
+            return_exceptions=True,
+        )
+        for coordinator, result in zip(coordinators, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning(
+                    "Failed to disconnect BLE for %s: %s",
+                    coordinator.ble_device.address, result,
+                )
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Disconnected BLE for all Berbel devices")
 
     # Register services only once
-    if not hass.services.has_service(DOMAIN, "set_immediate_refresh"):
+    if not domain_data["_services_registered"]:
         hass.services.async_register(
             DOMAIN,
             "set_immediate_refresh",
             handle_set_immediate_refresh,
             schema=SERVICE_SET_IMMEDIATE_REFRESH_SCHEMA,
         )
-
-    if not hass.services.has_service(DOMAIN, "disconnect_ble"):
         hass.services.async_register(
             DOMAIN,
             "disconnect_ble",
             handle_disconnect_ble,
         )
+        domain_data["_services_registered"] = True
 
     return True
 
@@ -91,35 +183,70 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Get the coordinator
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: BerbelDataUpdateCoordinator = entry.runtime_data
     
     # Clean up the coordinator and BLE connection
     await coordinator.async_cleanup()
     
     # Unload platforms
+    domain_data = hass.data[DOMAIN]
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        domain_data["_coordinators"].discard(coordinator)
 
     # Remove services if no more entries
-    if not hass.data[DOMAIN]:
+    if not domain_data["_coordinators"]:
         hass.services.async_remove(DOMAIN, "set_immediate_refresh")
         hass.services.async_remove(DOMAIN, "disconnect_ble")
+        if unsub := domain_data["_immediate_refresh_unsub"]:
+            unsub()
+            domain_data["_immediate_refresh_unsub"] = None
+        domain_data["_services_registered"] = False
 
     return unload_ok
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old entry."""
-    _LOGGER.debug("Migrating from version %s", config_entry.version)
-
-    if config_entry.version > 1:
+    if config_entry.version > 2:
         # This means the user has downgraded from a future version
+        _LOGGER.debug("Cannot migrate from version %s", config_entry.version)
         return False
 
     if config_entry.version == 1:
-        # No migration needed for version 1
-        pass
-
-    _LOGGER.info("Migration to version %s successful", config_entry.version)
+        # Version 2 stores the address upper-case, as the config flow does and
+        # as the BLE and seed lookups expect. Entity unique IDs and the device
+        # identifier are derived from it, so they are renamed along with it.
+        old_address = config_entry.data[CONF_ADDRESS]
+        new_address = old_address.upper()
+        if new_address != old_address:
+
+            @callback
+            def _async_migrate_unique_id(
+                entity_entry: er.RegistryEntry,
+            ) -> dict[str, Any] | None:
+                unique_id = entity_entry.unique_id
+                if not unique_id.startswith(f"{old_address}_"):
+                    return None
+                return {"new_unique_id": new_address + unique_id[len(old_address):]}
+
+            await er.async_migrate_entries(
+                hass, config_entry.entry_id, _async_migrate_unique_id
+            )
+
+            device_registry = dr.async_get(hass)
+            if device := device_registry.async_get_device(
+                identifiers={(DOMAIN, old_address)}
+            ):
+                device_registry.async_update_device(
+                    device.id, new_identifiers={(DOMAIN, new_address)}
+                )
+
+        hass.config_entries.async_update_entry(
+            config_entry,
+            data={**config_entry.data, CONF_ADDRESS: new_address},
+            version=2,
+        )
 
-    return True 
\ No newline at end of file
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("Migration to version %s successful", config_entry.version)
+    return True
@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 import asyncio
+import dataclasses
+import functools
 import logging
-from typing import Optional
+import sys
+import time
+import weakref
+from collections.abc import Coroutine
+from typing import Any, Optional
 from bleak import BleakClient, BleakError
 from bleak.backends.device import BLEDevice
+from bleak.backends.service import BleakGATTServiceCollection
 from bleak_retry_connector import establish_connection
 
 from .const import *
-from .models import BerbelDevice
-from .parser import BerbelBluetoothDeviceParser
+from .models import BerbelDevice, kelvin_to_color_percentage
+from .parser import parse_status
 from .legacy_parser import parse_legacy_manufacturer_data
 from .legacy_commands import LegacyCommandSender
 from .legacy_state import read_legacy_state_via_gatt
 from .commands import (
     create_light_brightness_command_from_percentage,
     validate_command_length,
+    ValidatedCommand,
     LightCommands,
     FanCommands
 )
@@ -27,36 +35,116 @@ _LOGGER = logging.getLogger(__name__)
 COLOR_BOTTOM_BYTE = 6
 COLOR_TOP_BYTE = 7
 
+# Advertised service UUIDs that identify legacy hoods (lower-case)
+LEGACY_SERVICE_UUIDS = frozenset({
+    LEGACY_UUID_SERVICE.lower(),
+    LEGACY_UUID_SERVICE_2018.lower(),
+})
+
+@functools.lru_cache(maxsize=512)
+def _brightness_command(top_percentage: int, bottom_percentage: int) -> bytes:
+    """Returns the (shared, immutable) light brightness command for a pair of percentages."""
+    return create_light_brightness_command_from_percentage(
+        top_percentage=top_percentage,
+        bottom_percentage=bottom_percentage
+    )
+
+
+# Kelvin -> color percentage (2700K = 100%, 6500K = 0%) for every integer Kelvin value
+_KELVIN_TO_PCT = {
+    kelvin: kelvin_to_color_percentage(kelvin)
+    for kelvin in range(MIN_KELVIN, MAX_KELVIN + 1)
+}
+
+
+def _brightness_matches(light_on: bool, current: int, requested: int) -> bool:
+    """Checks whether a light already has the requested brightness (0 = off)."""
+    if requested == 0:
+        return not light_on
+    return light_on and current == requested
+
+
 # Connection Pool Settings
 CONNECTION_TIMEOUT = 20.0  # Keep connection open for 20 seconds for regular updates
 COMMAND_DELAY = 0.1  # Short pause between commands
+CONNECT_MAX_ATTEMPTS = 3  # Connection attempts handled inside bleak-retry-connector
+STATUS_CACHE_MAX_AGE = 2.0  # Reuse a status read this recent for light read-modify-write
 
 
 class BerbelBluetoothDeviceData:
     """BLE client for Berbel range hoods with optimized connection management."""
 
+    __slots__ = (
+        "logger",
+        "_active_client",
+        "_active_device",
+        "_connection_timeout_handle",
+        "_loop",
+        "_disconnect_task",
+        "_cached_services",
+        "_cached_services_address",
+        "_disconnect_pending",
+        "_legacy_mode",
+        "_last_write_monotonic",
+        "_write_response_cache",
+        "_legacy_decision_cache",
+        "_status_cache",
+    )
+
+    # Per-address operation locks, see _lock_for
+    _locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
     def __init__(self, logger: logging.Logger = None):
         self.logger = logger or _LOGGER
         self._active_client: Optional[BleakClient] = None
         self._active_device: Optional[BLEDevice] = None
         self._connection_timeout_handle: Optional[asyncio.Handle] = None
-        self._connection_lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._disconnect_task: Optional[asyncio.Task] = None
+        self._cached_services: Optional[BleakGATTServiceCollection] = None
+        self._cached_services_address: Optional[str] = None
         self._disconnect_pending = False
         self._legacy_mode: bool = False
+        self._last_write_monotonic: Optional[float] = None
+        # Per-connection write mode per characteristic UUID, see _write_response_mode
+        self._write_response_cache: dict[str, Optional[bool]] = {}
+        # Legacy detection result per address and last extracted advertisement
+        # per address as (metadata dict, manufacturer data)
+        self._legacy_decision_cache: dict[str, bool] = {}
+        # Last parsed status per address: (monotonic timestamp, device)
+        self._status_cache: dict[str, tuple[float, BerbelDevice]] = {}
+
+    @classmethod
+    def _lock_for(cls, address: str) -> asyncio.Lock:
+        """Returns the lock serializing BLE operations on one device.
+
+        Locks are shared by all client instances, so e.g. the config flow and
+        the coordinator cannot talk to the same hood at once, while different
+        hoods are never blocked by each other. Unused locks are dropped
+        automatically. An instance still keeps a single active connection,
+        so it should only be used for one hood.
+        """
+        lock = cls._locks.get(address)
+        if lock is None:
+            lock = cls._locks[address] = asyncio.Lock()
+        return lock
 
     async def _ensure_connection(self, ble_device: BLEDevice) -> BleakClient:
         """Ensures an active BLE connection exists or establishes one."""
-        # Check if we already have a valid connection to the same device
-        if (self._active_client and
-            self._active_client.is_connected and
-            self._active_device and
-            self._active_device.address == ble_device.address and
-            not self._disconnect_pending):
+        # Check if we already have a valid connection to the same device.
+        # Cheap identity/flag checks first; is_connected may call into the backend.
+        active_client = self._active_client
+        active_device = self._active_device
+        if (active_client is not None and
+            not self._disconnect_pending and
+            active_device is not None and
+            active_device.address == ble_device.address and
+            active_client.is_connected):
 
             self.logger.debug("BLE-Client: Using existing connection")
             # Extend timeout
             self._schedule_disconnect()
-            return self._active_client
+            return active_client
 
         # Disconnect old connection if present
         if self._active_client:
@@ -65,11 +153,30 @@ class BerbelBluetoothDeviceData:
 
         # Establish new connection
         self.logger.debug("BLE-Client: Establishing new connection...")
-        client = await establish_connection(BleakClient, ble_device, ble_device.address)
+        # Reuse the GATT table from the previous connection to this device so
+        # reconnects can skip service discovery
+        cached_services = (
+            self._cached_services
+            if self._cached_services_address == ble_device.address
+            else None
+        )
+        client = await establish_connection(
+            BleakClient,
+            ble_device,
+            ble_device.address,
+            max_attempts=CONNECT_MAX_ATTEMPTS,
+            cached_services=cached_services,
+            use_services_cache=True,
+        )
+        self._cached_services = client.services
+        self._cached_services_address = ble_device.address
 
         self._active_client = client
         self._active_device = ble_device
         self._disconnect_pending = False
+        self._write_response_cache = {}
+        # Connecting took far longer than COMMAND_DELAY, no pacing needed
+        self._last_write_monotonic = None
 
         # Schedule auto-disconnect after timeout
         self._schedule_disconnect()
@@ -82,30 +189,108 @@ class BerbelBluetoothDeviceData:
         if self._connection_timeout_handle:
             self._connection_timeout_handle.cancel()
 
-        def disconnect_callback():
-            """Callback for automatic disconnection."""
-            if not self._disconnect_pending:
-                self._disconnect_pending = True
-                asyncio.create_task(self._disconnect_internal())
-
-        loop = asyncio.get_event_loop()
-        self._connection_timeout_handle = loop.call_later(
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        self._connection_timeout_handle = self._loop.call_later(
             CONNECTION_TIMEOUT,
-            disconnect_callback
+            self._on_disconnect_timeout
         )
 
+    def _on_disconnect_timeout(self) -> None:
+        """Callback for automatic disconnection."""
+        if self._disconnect_pending:
+            return
+        self._disconnect_pending = True
+        self._connection_timeout_handle = None
+
+        client = self._active_client
+        if client is None or not client.is_connected:
+            # Nothing to tear down on the BLE side, finish synchronously
+            self._active_client = None
+            self._active_device = None
+            self._disconnect_pending = False
+            return
+
+        # Start eagerly so the task runs inline until its first real await;
+        # keep a reference so it is not garbage collected while pending
+        if sys.version_info >= (3, 12):
+            task = asyncio.Task(
+                self._disconnect_internal(), loop=self._loop, eager_start=True
+            )
+        else:
+            task = self._loop.create_task(self._disconnect_internal())
+        self._disconnect_task = task
+        task.add_done_callback(self._on_disconnect_task_done)
+
+    def _on_disconnect_task_done(self, task: asyncio.Task) -> None:
+        """Drops the reference to a finished disconnect task."""
+        if self._disconnect_task is task:
+            self._disconnect_task = None
+
+    async def _pace_write(self) -> None:
+        """Keeps at least COMMAND_DELAY between consecutive writes on a connection."""
+        last_write = self._last_write_monotonic
+        if last_write is None:
+            # First write on this connection: just yield to the event loop
+            await asyncio.sleep(0)
+            return
+        remaining = COMMAND_DELAY - (time.monotonic() - last_write)
+        await asyncio.sleep(remaining if remaining > 0 else 0)
+
+    async def _write_gatt(
+        self, client: BleakClient, uuid: str, data: bytes | bytearray, response: Optional[bool] = None
+    ) -> None:
+        """Writes a characteristic and records the write time for pacing."""
+        if response is None:
+            await client.write_gatt_char(uuid, data)
+        else:
+            await client.write_gatt_char(uuid, data, response=response)
+        self._last_write_monotonic = time.monotonic()
+
+    async def _write_command(self, client: BleakClient, command: bytes) -> None:
+        """Writes a fan/light command, without response if the device allows it.
+
+        Commands are fire-and-forget; the resulting state is confirmed by the
+        next status read.
+        """
+        await self._write_gatt(
+            client, WRITE_COMMANDS, command,
+            response=self._write_response_mode(client, WRITE_COMMANDS),
+        )
+
+    def _write_response_mode(self, client: BleakClient, uuid: str) -> Optional[bool]:
+        """Returns False if the characteristic accepts write-without-response, else None.
+
+        None leaves the choice to bleak. The result is cached per connection.
+        """
+        try:
+            return self._write_response_cache[uuid]
+        except KeyError:
+            pass
+        response = None
+        try:
+            char = client.services.get_characteristic(uuid)
+            if char is not None and "write-without-response" in char.properties:
+                response = False
+        except Exception as e:
+            self.logger.debug("BLE-Client: Could not inspect properties of %s: %s", uuid, e)
+        self._write_response_cache[uuid] = response
+        return response
+
     async def _disconnect_internal(self):
         """Disconnects the internal connection."""
         if self._connection_timeout_handle:
             self._connection_timeout_handle.cancel()
             self._connection_timeout_handle = None
+        # Look the loop up again on the next connection (it may change across reloads)
+        self._loop = None
 
         if self._active_client:
             try:
                 await self._active_client.disconnect()
                 self.logger.debug("BLE-Client: Connection disconnected")
             except Exception as e:
-                self.logger.debug(f"BLE-Client: Error during disconnect: {e}")
+                self.logger.debug("BLE-Client: Error during disconnect: %s", e)
             finally:
                 self._active_client = None
                 self._active_device = None
@@ -116,78 +301,160 @@ class BerbelBluetoothDeviceData:
         # Legacy devices: try to parse advertisement manufacturer data exposed by Bleak device metadata
         if self._legacy_mode:
             try:
-                adv = None
-                if hasattr(self._active_device, "metadata") and isinstance(self._active_device.metadata, dict):
-                    # bleak stores manufacturer_data as {company_id: bytes}
-                    mfd = self._active_device.metadata.get("manufacturer_data") or {}
-                    if isinstance(mfd, dict) and len(mfd) > 0:
-                        # Use the first entry
-                        adv = next(iter(mfd.values()))
+                adv = self._legacy_adv_data(self._active_device)
                 data = parse_legacy_manufacturer_data(adv) if adv is not None else None
                 if data:
-                    for key, value in data.items():
-                        setattr(device, key, value)
-                    return device
+                    return dataclasses.replace(device, **data)
                 else:
                     raise NotImplementedError("Legacy advertisement data not available to parse")
             except Exception as e:
-                self.logger.warning(f"Legacy parsing failed or not available: {e}")
+                self.logger.warning("Legacy parsing failed or not available: %s", e)
                 # Fallback to returning whatever we have (mostly defaults)
                 return device
         try:
-            status = await client.read_gatt_char(READ_STATE)
-            brightness = await client.read_gatt_char(READ_WRITE_LIGHT_BRIGHTNESS)
-            colors = await client.read_gatt_char(READ_WRITE_LIGHT_COLOR)
+            # Issue the three reads together; backends that pipeline ATT
+            # requests overlap them, others simply run them in order
+            status, brightness, colors = await asyncio.gather(
+                client.read_gatt_char(READ_STATE),
+                client.read_gatt_char(READ_WRITE_LIGHT_BRIGHTNESS),
+                client.read_gatt_char(READ_WRITE_LIGHT_COLOR),
+            )
 
             self.logger.debug("Status data received:")
-            self.logger.debug(f"Status: {status.hex()}")
-            self.logger.debug(f"Brightness: {brightness.hex()}")
-            self.logger.debug(f"Colors: {colors.hex()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Status: %s", status.hex())
+                self.logger.debug("Brightness: %s", brightness.hex())
+                self.logger.debug("Colors: %s", colors.hex())
 
-            data = BerbelBluetoothDeviceParser.parse_status(status, brightness, colors)
+            data = parse_status(status, brightness, colors)
 
-            # Simple assignment of parsed data
-            for key, value in data.items():
-                setattr(device, key, value)
+            # BerbelDevice is frozen; copy the parsed data into a new instance
+            device = dataclasses.replace(device, **data)
 
-            self.logger.info(
-                f"Device Status: Fan={device.fan_level}, Postrun={device.fan_postrun_active}, "
-                f"Top Light={device.light_top_on}({device.light_top_brightness}%, {device.light_top_color_kelvin}K), "
-                f"Bottom Light={device.light_bottom_on}({device.light_bottom_brightness}%, {device.light_bottom_color_kelvin}K)"
-            )
+            self._status_cache[device.address] = (time.monotonic(), device)
+
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Device Status: Fan=%s, Postrun=%s, Top Light=%s(%s%%, %sK), Bottom Light=%s(%s%%, %sK)",
+                    device.fan_level, device.fan_postrun_active,
+                    device.light_top_on, device.light_top_brightness, device.light_top_color_kelvin,
+                    device.light_bottom_on, device.light_bottom_brightness, device.light_bottom_color_kelvin,
+                )
 
             return device
 
         except BleakError as e:
-            self.logger.error(f"BLE error reading data: {e}")
+            self.logger.error("BLE error reading data: %s", e)
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error reading status: {e}")
+            self.logger.error("Unexpected error reading status: %s", e)
             raise
 
+    async def _get_status_cached(
+        self, client: BleakClient, device: BerbelDevice, max_age: float = STATUS_CACHE_MAX_AGE
+    ) -> BerbelDevice:
+        """Returns a recently read status for the device or reads it from BLE."""
+        cached = self._status_cache.get(device.address)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            self.logger.debug("BLE-Client: Using cached status")
+            return cached[1]
+        return await self._get_status(client, device)
+
+    def _update_cached_status(self, address: str, **changes) -> None:
+        """Applies the values just written to the cached status, if any.
+
+        The cached object may already be held by the coordinator, so it is
+        replaced rather than mutated. The timestamp of the last real read is
+        kept, so writes cannot keep unread values of the other light fresh.
+        """
+        cached = self._status_cache.get(address)
+        if cached is not None:
+            self._status_cache[address] = (cached[0], dataclasses.replace(cached[1], **changes))
+
+    def _cached_status_matches(
+        self,
+        address: str,
+        top_brightness: Optional[int],
+        bottom_brightness: Optional[int],
+        top_color: Optional[int],
+        bottom_color: Optional[int],
+    ) -> bool:
+        """Checks whether a recent cached status already has the requested light values.
+
+        Values given as None are ignored; brightness 0 matches a light that is off.
+        """
+        cached = self._status_cache.get(address)
+        if cached is None or time.monotonic() - cached[0] >= STATUS_CACHE_MAX_AGE:
+            return False
+        device = cached[1]
+        if top_brightness is not None and not _brightness_matches(
+            device.light_top_on, device.light_top_brightness, top_brightness
+        ):
+            return False
+        if bottom_brightness is not None and not _brightness_matches(
+            device.light_bottom_on, device.light_bottom_brightness, bottom_brightness
+        ):
+            return False
+        if top_color is not None and device.light_top_color != top_color:
+            return False
+        if bottom_color is not None and device.light_bottom_color != bottom_color:
+            return False
+        return True
+
+    def _invalidate_cached_status(self, address: str) -> None:
+        """Drops the cached status after a write with unknown effect."""
+        self._status_cache.pop(address, None)
+
+    def _invalidate_services_cache(self) -> None:
+        """Forgets the cached GATT table so the next connect discovers it again.
+
+        Called on BLE errors, which may come from a changed service table
+        (e.g. after a firmware update) that the cache no longer matches.
+        """
+        self._cached_services = None
+        self._cached_services_address = None
+
     def _detect_legacy(self, ble_device: BLEDevice) -> bool:
         """Detect if the device is an older-model (legacy) hood.
         Heuristics: device name equals DEFAULT_LEGACY_DEVICE_NAME or service UUID matches legacy ones (if available).
+        Only a positive result is cached per address: a first advertisement
+        may lack the legacy service UUIDs, so a negative one is checked again.
         """
+        cached = self._legacy_decision_cache.get(ble_device.address)
+        if cached is not None:
+            return cached
         try:
             name = (ble_device.name or "").upper()
-            if DEFAULT_LEGACY_DEVICE_NAME in name:
-                return True
-            # Bleak may provide advertised service UUIDs in metadata
-            uuids = []
-            if hasattr(ble_device, "metadata") and isinstance(ble_device.metadata, dict):
-                uuids = [u.lower() for u in (ble_device.metadata.get("uuids") or [])]
-            legacy_candidates = {
-                LEGACY_UUID_SERVICE.lower(),
-                LEGACY_UUID_SERVICE_2018.lower(),
-            }
-            return any(u in legacy_candidates for u in uuids)
+            is_legacy = DEFAULT_LEGACY_DEVICE_NAME in name
+            if not is_legacy:
+                # Bleak may provide advertised service UUIDs in metadata
+                metadata = getattr(ble_device, "metadata", None)
+                if isinstance(metadata, dict):
+                    is_legacy = any(
+                        u.lower() in LEGACY_SERVICE_UUIDS for u in (metadata.get("uuids") or [])
+                    )
         except Exception:
             return False
+        if is_legacy:
+            self._legacy_decision_cache[ble_device.address] = True
+        return is_legacy
+
+    def _legacy_adv_data(self, ble_device: Optional[BLEDevice]) -> Optional[bytes]:
+        """Returns the first manufacturer data entry advertised by a legacy device."""
+        metadata = getattr(ble_device, "metadata", None)
+        if not isinstance(metadata, dict):
+            return None
+        # bleak stores manufacturer_data as {company_id: bytes}; the dict may be
+        # updated in place, so it is read on every call
+        mfd = metadata.get("manufacturer_data") or {}
+        if isinstance(mfd, dict) and len(mfd) > 0:
+            # Use the first entry
+            return next(iter(mfd.values()))
+        return None
 
     async def update_device(self, ble_device: BLEDevice, max_retries: int = 2) -> BerbelDevice:
         """Connects to device via BLE and retrieves relevant data."""
-        self.logger.info(f"BLE-Client: update_device called - Device: {ble_device.address}")
+        self.logger.info("BLE-Client: update_device called - Device: %s", ble_device.address)
 
         if ble_device is None:
             raise ValueError("BLEDevice cannot be None")
@@ -207,28 +474,22 @@ class BerbelBluetoothDeviceData:
             device = BerbelDevice(name=ble_device.name or "", address=ble_device.address)
             try:
                 # Populate from manufacturer data first
-                adv = None
-                if hasattr(ble_device, "metadata") and isinstance(ble_device.metadata, dict):
-                    mfd = ble_device.metadata.get("manufacturer_data") or {}
-                    if isinstance(mfd, dict) and len(mfd) > 0:
-                        adv = next(iter(mfd.values()))
+                adv = self._legacy_adv_data(ble_device)
                 data = parse_legacy_manufacturer_data(adv) if adv is not None else None
                 if data:
-                    for k, v in data.items():
-                        setattr(device, k, v)
+                    device = dataclasses.replace(device, **data)
                     self.logger.info("BLE-Client: Legacy status parsed from advertisements (no GATT connection).")
                     return device
                 else:
                     # Try a short-lived GATT read on TX/CF as a fallback
                     try:
-                        async with self._connection_lock:
+                        async with self._lock_for(ble_device.address):
                             client = await self._ensure_connection(ble_device)
                             gatt_data = await read_legacy_state_via_gatt(client)
                     finally:
                         await self._disconnect_internal()
                     if gatt_data:
-                        for k, v in gatt_data.items():
-                            setattr(device, k, v)
+                        device = dataclasses.replace(device, **gatt_data)
                         self.logger.info("BLE-Client: Legacy status read via GATT TX/CF.")
                         return device
                     self.logger.warning("BLE-Client: Legacy state unavailable (no adv, GATT fallback failed). Returning defaults.")
@@ -240,7 +501,7 @@ class BerbelBluetoothDeviceData:
         last_exception = None
         for attempt in range(1, max_retries + 1):
             try:
-                async with self._connection_lock:
+                async with self._lock_for(ble_device.address):
                     client = await self._ensure_connection(ble_device)
 
                     device = BerbelDevice(
@@ -248,7 +509,7 @@ class BerbelBluetoothDeviceData:
                         address=ble_device.address
                     )
 
-                    self.logger.debug(f"BLE-Client: Reading status data... (attempt {attempt}/{max_retries})")
+                    self.logger.debug("BLE-Client: Reading status data... (attempt %s/%s)", attempt, max_retries)
                     device = await self._get_status(client, device)
 
                     self.logger.info("BLE-Client: Data query successful")
@@ -256,10 +517,12 @@ class BerbelBluetoothDeviceData:
 
             except Exception as e:
                 last_exception = e
-                self.logger.warning(f"BLE-Client: Status update attempt {attempt}/{max_retries} failed: {e}")
+                self.logger.warning("BLE-Client: Status update attempt %s/%s failed: %s", attempt, max_retries, e)
 
-                # Immediately disconnect on connection errors
+                # Immediately disconnect on connection errors; the retry then
+                # also runs a fresh service discovery
                 if isinstance(e, BleakError):
+                    self._invalidate_services_cache()
                     await self._disconnect_internal()
 
                 # Short pause before next attempt
@@ -268,25 +531,28 @@ class BerbelBluetoothDeviceData:
 
         # Last attempt failed - disconnect connection
         await self._disconnect_internal()
-        self.logger.error(f"BLE-Client: All {max_retries} status update attempts failed")
+        self.logger.error("BLE-Client: All %s status update attempts failed", max_retries)
         raise last_exception if last_exception else RuntimeError("Status update failed")
 
     async def _execute_command(self, ble_device: BLEDevice, command: bytes) -> None:
         """Executes a command on the BLE device with optimized connection."""
-        self.logger.info(f"BLE-Client: _execute_command called - Device: {ble_device.address}, Command: {command.hex()}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("BLE-Client: _execute_command called - Device: %s, Command: %s", ble_device.address, command.hex())
 
         if ble_device is None:
             raise ValueError("BLEDevice cannot be None")
 
-        validate_command_length(command)
-        self.logger.debug(f"BLE-Client: Command length validated: {len(command)} bytes")
+        # Generated and predefined commands were validated when they were built
+        if not isinstance(command, ValidatedCommand):
+            validate_command_length(command)
+            self.logger.debug("BLE-Client: Command length validated: %s bytes", len(command))
 
-        async with self._connection_lock:
+        async with self._lock_for(ble_device.address):
             try:
                 client = await self._ensure_connection(ble_device)
 
                 # Short wait for BLE stability
-                await asyncio.sleep(COMMAND_DELAY)
+                await self._pace_write()
 
                 if self._legacy_mode:
                     # Older models expect URL-encoded ASCII commands written to RX.
@@ -298,145 +564,154 @@ class BerbelBluetoothDeviceData:
                     )
                     raise NotImplementedError("Legacy command execution not implemented")
 
-                self.logger.debug(f"BLE-Client: Sending command to UUID: {WRITE_COMMANDS}")
-                await client.write_gatt_char(WRITE_COMMANDS, command)
-                self.logger.debug(f"BLE-Client: Command written successfully")
+                self.logger.debug("BLE-Client: Sending command to UUID: %s", WRITE_COMMANDS)
+                await self._write_command(client, command)
+                self.logger.debug("BLE-Client: Command written successfully")
+                self._invalidate_cached_status(ble_device.address)
 
-                self.logger.info(f"BLE-Client: Command {command.hex()} sent successfully")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("BLE-Client: Command %s sent successfully", command.hex())
 
             except Exception as e:
-                self.logger.error(f"BLE-Client: Command execution failed: {e}")
+                self.logger.error("BLE-Client: Command execution failed: %s", e)
+                if isinstance(e, BleakError):
+                    self._invalidate_services_cache()
                 # Disconnect on errors
                 await self._disconnect_internal()
                 raise
 
-    async def _execute_command_with_status(self, ble_device: BLEDevice, command: bytes) -> BerbelDevice:
-        """Executes a command and immediately reads status in one connection."""
-        self.logger.info(f"BLE-Client: _execute_command_with_status called - Device: {ble_device.address}")
-
-        if ble_device is None:
-            raise ValueError("BLEDevice cannot be None")
-
-        validate_command_length(command)
-
-        async with self._connection_lock:
-            try:
-                client = await self._ensure_connection(ble_device)
-
-                # Send command
-                await asyncio.sleep(COMMAND_DELAY)
-                await client.write_gatt_char(WRITE_COMMANDS, command)
-                self.logger.debug(f"BLE-Client: Command sent: {command.hex()}")
-
-                # Wait briefly for device to update status
-                await asyncio.sleep(0.2)
-
-                # Read status
-                device = BerbelDevice(
-                    name=ble_device.name or "",
-                    address=ble_device.address
-                )
-                device = await self._get_status(client, device)
-
-                self.logger.info(f"BLE-Client: Command and status update successful")
-                return device
-
-            except Exception as e:
-                self.logger.error(f"BLE-Client: Command+status failed: {e}")
-                await self._disconnect_internal()
-                raise
-
     # === OPTIMIZED LIGHT CONTROL ===
 
-    async def set_light_top_on(self, ble_device: BLEDevice, on: bool = True) -> None:
-        """Turns the top light on or off while maintaining bottom light state."""
-        # Legacy: write ASCII command and disconnect quickly; avoid status read
+    async def set_light_state(
+        self,
+        ble_device: BLEDevice,
+        top_brightness: Optional[int] = None,
+        bottom_brightness: Optional[int] = None,
+        top_color: Optional[int] = None,
+        bottom_color: Optional[int] = None,
+    ) -> None:
+        """Sets brightness and/or color of the lights in one connection (0-100%).
+
+        Values left as None keep the current state of that light. Brightness and
+        color are written under a single lock acquire, reading the current state
+        only when a brightness or color value has to be preserved.
+        """
+        for field, value in (
+            ("top_brightness", top_brightness),
+            ("bottom_brightness", bottom_brightness),
+            ("top_color", top_color),
+            ("bottom_color", bottom_color),
+        ):
+            if value is not None and not 0 <= value <= 100:
+                raise ValueError(f"{field} must be between 0 and 100")
+
+        set_brightness = top_brightness is not None or bottom_brightness is not None
+        set_color = top_color is not None or bottom_color is not None
+        if not set_brightness and not set_color:
+            return
+
+        # Legacy: map brightness to on/off only (no dimming or color via ASCII known)
         if self._legacy_mode:
-            async with self._connection_lock:
+            if not set_brightness:
+                self.logger.warning("BLE-Client: Light color is not supported on legacy models")
+                return
+            async with self._lock_for(ble_device.address):
                 try:
                     client = await self._ensure_connection(ble_device)
                     sender = LegacyCommandSender()
-                    if on:
+                    if (top_brightness or 0) > 0 or (bottom_brightness or 0) > 0:
                         await sender.lights_on(client)
                     else:
                         await sender.lights_off(client)
                     return
                 except Exception as e:
-                    self.logger.error(f"BLE-Client: Top light (legacy) switching failed: {e}")
+                    self.logger.error("BLE-Client: Setting light state (legacy) failed: %s", e)
                     await self._disconnect_internal()
                     raise
-        # Fast method: Read current status and then command in one connection
-        async with self._connection_lock:
+
+        if self._cached_status_matches(
+            ble_device.address, top_brightness, bottom_brightness, top_color, bottom_color
+        ):
+            self.logger.debug("BLE-Client: Light state unchanged, skipping write")
+            # Keep an open connection warm as if a command had been sent
+            active_device = self._active_device
+            if (self._active_client is not None and not self._disconnect_pending and
+                    active_device is not None and active_device.address == ble_device.address):
+                self._schedule_disconnect()
+            return
+
+        async with self._lock_for(ble_device.address):
             try:
                 client = await self._ensure_connection(ble_device)
 
-                # Read status
-                device = BerbelDevice(name=ble_device.name or "", address=ble_device.address)
-                device = await self._get_status(client, device)
+                if set_brightness:
+                    if top_brightness is None or bottom_brightness is None:
+                        # Read status to maintain the other light
+                        device = BerbelDevice(name=ble_device.name or "", address=ble_device.address)
+                        device = await self._get_status_cached(client, device)
+                        if top_brightness is None:
+                            top_brightness = device.light_top_brightness if device.light_top_on else 0
+                        if bottom_brightness is None:
+                            bottom_brightness = device.light_bottom_brightness if device.light_bottom_on else 0
+
+                    command = _brightness_command(top_brightness, bottom_brightness)
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("BLE-Client: Light command generated: %s", command.hex())
+
+                    # Send command
+                    await self._pace_write()
+                    await self._write_command(client, command)
+                    self._update_cached_status(
+                        ble_device.address,
+                        light_top_on=top_brightness > 0,
+                        light_top_brightness=top_brightness,
+                        light_bottom_on=bottom_brightness > 0,
+                        light_bottom_brightness=bottom_brightness,
+                    )
 
-                # Generate command
-                current_bottom = device.light_bottom_brightness if device.light_bottom_on else 0
-                top_brightness = 100 if on else 0
+                if set_color:
+                    # Read current color values
+                    current_colors = await client.read_gatt_char(READ_WRITE_LIGHT_COLOR)
+                    # bleak usually returns a fresh bytearray which can be patched in place
+                    new_colors = (
+                        current_colors if isinstance(current_colors, bytearray)
+                        else bytearray(current_colors)
+                    )
+                    changes = {}
+                    if top_color is not None and len(new_colors) > COLOR_TOP_BYTE:
+                        new_colors[COLOR_TOP_BYTE] = int(top_color * 255 / 100)
+                        changes["light_top_color"] = top_color
+                    if bottom_color is not None and len(new_colors) > COLOR_BOTTOM_BYTE:
+                        new_colors[COLOR_BOTTOM_BYTE] = int(bottom_color * 255 / 100)
+                        changes["light_bottom_color"] = bottom_color
+
+                    # Write-without-response where supported; the next status
+                    # poll confirms the new colors anyway
+                    await self._write_gatt(
+                        client, READ_WRITE_LIGHT_COLOR, new_colors,
+                        response=self._write_response_mode(client, READ_WRITE_LIGHT_COLOR),
+                    )
+                    self._update_cached_status(ble_device.address, **changes)
 
-                command = create_light_brightness_command_from_percentage(
-                    top_percentage=top_brightness,
-                    bottom_percentage=current_bottom
+                self.logger.info(
+                    "BLE-Client: Light state set - brightness top/bottom: %s/%s%%, color top/bottom: %s/%s%%",
+                    top_brightness, bottom_brightness, top_color, bottom_color,
                 )
 
-                # Send command
-                await asyncio.sleep(COMMAND_DELAY)
-                await client.write_gatt_char(WRITE_COMMANDS, command)
-
-                self.logger.info(f"BLE-Client: Top light turned {'on' if on else 'off'}")
-
             except Exception as e:
-                self.logger.error(f"BLE-Client: Top light switching failed: {e}")
+                self.logger.error("BLE-Client: Setting light state failed: %s", e)
+                if isinstance(e, BleakError):
+                    self._invalidate_services_cache()
                 await self._disconnect_internal()
                 raise
 
+    async def set_light_top_on(self, ble_device: BLEDevice, on: bool = True) -> None:
+        """Turns the top light on or off while maintaining bottom light state."""
+        await self.set_light_state(ble_device, top_brightness=100 if on else 0)
+
     async def set_light_bottom_on(self, ble_device: BLEDevice, on: bool = True) -> None:
         """Turns the bottom light on or off while maintaining top light state."""
-        if self._legacy_mode:
-            async with self._connection_lock:
-                try:
-                    client = await self._ensure_connection(ble_device)
-                    sender = LegacyCommandSender()
-                    if on:
-                        await sender.lights_on(client)
-                    else:
-                        await sender.lights_off(client)
-                    return
-                except Exception as e:
-                    self.logger.error(f"BLE-Client: Bottom light (legacy) switching failed: {e}")
-                    await self._disconnect_internal()
-                    raise
-        async with self._connection_lock:
-            try:
-                client = await self._ensure_connection(ble_device)
-
-                # Read status
-                device = BerbelDevice(name=ble_device.name or "", address=ble_device.address)
-                device = await self._get_status(client, device)
-
-                # Generate command
-                current_top = device.light_top_brightness if device.light_top_on else 0
-                bottom_brightness = 100 if on else 0
-
-                command = create_light_brightness_command_from_percentage(
-                    top_percentage=current_top,
-                    bottom_percentage=bottom_brightness
-                )
-
-                # Send command
-                await asyncio.sleep(COMMAND_DELAY)
-                await client.write_gatt_char(WRITE_COMMANDS, command)
-
-                self.logger.info(f"BLE-Client: Bottom light turned {'on' if on else 'off'}")
-
-            except Exception as e:
-                self.logger.error(f"BLE-Client: Bottom light switching failed: {e}")
-                await self._disconnect_internal()
-                raise
+        await self.set_light_state(ble_device, bottom_brightness=100 if on else 0)
 
     async def set_both_lights_on(self, ble_device: BLEDevice, on: bool = True) -> None:
         """Turns both lights on or off."""
@@ -444,7 +719,7 @@ class BerbelBluetoothDeviceData:
         bottom_brightness = 100 if on else 0
 
         if self._legacy_mode:
-            async with self._connection_lock:
+            async with self._lock_for(ble_device.address):
                 client = await self._ensure_connection(ble_device)
                 sender = LegacyCommandSender()
                 if on:
@@ -453,127 +728,26 @@ class BerbelBluetoothDeviceData:
                     await sender.lights_off(client)
                 return
 
-        command = create_light_brightness_command_from_percentage(
-            top_percentage=top_brightness,
-            bottom_percentage=bottom_brightness
-        )
+        command = _brightness_command(top_brightness, bottom_brightness)
         await self._execute_command(ble_device, command)
 
     async def set_light_top_brightness(self, ble_device: BLEDevice, brightness_percentage: int) -> None:
         """Sets the brightness of the top light (0-100%) - optimized."""
-        self.logger.info(f"BLE-Client: set_light_top_brightness called - Brightness: {brightness_percentage}%, Device: {ble_device.address}")
-
         if not 0 <= brightness_percentage <= 100:
             raise ValueError("brightness_percentage must be between 0 and 100")
-
-        # Legacy: map brightness to on/off only (no dimming via ASCII known)
-        if self._legacy_mode:
-            async with self._connection_lock:
-                try:
-                    client = await self._ensure_connection(ble_device)
-                    sender = LegacyCommandSender()
-                    if brightness_percentage > 0:
-                        await sender.lights_on(client)
-                    else:
-                        await sender.lights_off(client)
-                    return
-                except Exception as e:
-                    self.logger.error(f"BLE-Client: Setting top brightness (legacy) failed: {e}")
-                    await self._disconnect_internal()
-                    raise
-
-        # Optimized version: Read status and command in one connection
-        async with self._connection_lock:
-            try:
-                client = await self._ensure_connection(ble_device)
-
-                # Read status to maintain bottom light
-                device = BerbelDevice(name=ble_device.name or "", address=ble_device.address)
-                device = await self._get_status(client, device)
-
-                current_bottom = device.light_bottom_brightness if device.light_bottom_on else 0
-                self.logger.debug(f"BLE-Client: Current bottom brightness: {current_bottom}%")
-
-                command = create_light_brightness_command_from_percentage(
-                    top_percentage=brightness_percentage,
-                    bottom_percentage=current_bottom
-                )
-                self.logger.debug(f"BLE-Client: Light command generated: {command.hex()}")
-
-                # Send command
-                await asyncio.sleep(COMMAND_DELAY)
-                await client.write_gatt_char(WRITE_COMMANDS, command)
-
-                self.logger.info(f"BLE-Client: Top brightness set to {brightness_percentage}%")
-
-            except Exception as e:
-                self.logger.error(f"BLE-Client: Setting top brightness failed: {e}")
-                await self._disconnect_internal()
-                raise
+        await self.set_light_state(ble_device, top_brightness=brightness_percentage)
 
     async def set_light_bottom_brightness(self, ble_device: BLEDevice, brightness_percentage: int) -> None:
         """Sets the brightness of the bottom light (0-100%) - optimized."""
-        self.logger.info(f"BLE-Client: set_light_bottom_brightness called - Brightness: {brightness_percentage}%, Device: {ble_device.address}")
-
         if not 0 <= brightness_percentage <= 100:
             raise ValueError("brightness_percentage must be between 0 and 100")
-
-        # Legacy: map brightness to on/off only
-        if self._legacy_mode:
-            async with self._connection_lock:
-                try:
-                    client = await self._ensure_connection(ble_device)
-                    sender = LegacyCommandSender()
-                    if brightness_percentage > 0:
-                        await sender.lights_on(client)
-                    else:
-                        await sender.lights_off(client)
-                    return
-                except Exception as e:
-                    self.logger.error(f"BLE-Client: Setting bottom brightness (legacy) failed: {e}")
-                    await self._disconnect_internal()
-                    raise
-
-        async with self._connection_lock:
-            try:
-                client = await self._ensure_connection(ble_device)
-
-                # Read status to maintain top light
-                device = BerbelDevice(name=ble_device.name or "", address=ble_device.address)
-                device = await self._get_status(client, device)
-
-                current_top = device.light_top_brightness if device.light_top_on else 0
-                self.logger.debug(f"BLE-Client: Current top brightness: {current_top}%")
-
-                command = create_light_brightness_command_from_percentage(
-                    top_percentage=current_top,
-                    bottom_percentage=brightness_percentage
-                )
-                self.logger.debug(f"BLE-Client: Light command generated: {command.hex()}")
-
-                # Send command
-                await asyncio.sleep(COMMAND_DELAY)
-                await client.write_gatt_char(WRITE_COMMANDS, command)
-
-                self.logger.info(f"BLE-Client: Bottom brightness set to {brightness_percentage}%")
-
-            except Exception as e:
-                self.logger.error(f"BLE-Client: Setting bottom brightness failed: {e}")
-                await self._disconnect_internal()
-                raise
+        await self.set_light_state(ble_device, bottom_brightness=brightness_percentage)
 
     async def set_both_lights_brightness(self, ble_device: BLEDevice, top_brightness: int, bottom_brightness: int) -> None:
         """Sets the brightness of both lights simultaneously (0-100%)."""
-        if not 0 <= top_brightness <= 100:
-            raise ValueError("top_brightness must be between 0 and 100")
-        if not 0 <= bottom_brightness <= 100:
-            raise ValueError("bottom_brightness must be between 0 and 100")
-
-        command = create_light_brightness_command_from_percentage(
-            top_percentage=top_brightness,
-            bottom_percentage=bottom_brightness
+        await self.set_light_state(
+            ble_device, top_brightness=top_brightness, bottom_brightness=bottom_brightness
         )
-        await self._execute_command(ble_device, command)
 
     # === COLOR CONTROL (simplified) ===
 
@@ -581,85 +755,27 @@ class BerbelBluetoothDeviceData:
         """Sets the color of the top light (0-100%, 0=6500K, 100=2700K)."""
         if not 0 <= color_percentage <= 100:
             raise ValueError("color_percentage must be between 0 and 100")
-
-        color_value = int(color_percentage * 255 / 100)
-
-        async with self._connection_lock:
-            try:
-                client = await self._ensure_connection(ble_device)
-
-                # Read current color values
-                current_colors = await client.read_gatt_char(READ_WRITE_LIGHT_COLOR)
-                new_colors = bytearray(current_colors)
-                if len(new_colors) > COLOR_TOP_BYTE:
-                    new_colors[COLOR_TOP_BYTE] = color_value
-
-                await client.write_gatt_char(READ_WRITE_LIGHT_COLOR, bytes(new_colors))
-                self.logger.info(f"Top light color set to {color_percentage}%")
-
-            except Exception as e:
-                self.logger.error(f"BLE-Client: Setting top color failed: {e}")
-                await self._disconnect_internal()
-                raise
+        await self.set_light_state(ble_device, top_color=color_percentage)
 
     async def set_light_bottom_color(self, ble_device: BLEDevice, color_percentage: int) -> None:
         """Sets the color of the bottom light (0-100%, 0=6500K, 100=2700K)."""
         if not 0 <= color_percentage <= 100:
             raise ValueError("color_percentage must be between 0 and 100")
-
-        color_value = int(color_percentage * 255 / 100)
-
-        async with self._connection_lock:
-            try:
-                client = await self._ensure_connection(ble_device)
-
-                # Read current color values
-                current_colors = await client.read_gatt_char(READ_WRITE_LIGHT_COLOR)
-                new_colors = bytearray(current_colors)
-                if len(new_colors) > COLOR_BOTTOM_BYTE:
-                    new_colors[COLOR_BOTTOM_BYTE] = color_value
-
-                await client.write_gatt_char(READ_WRITE_LIGHT_COLOR, bytes(new_colors))
-                self.logger.info(f"Bottom light color set to {color_percentage}%")
-
-            except Exception as e:
-                self.logger.error(f"BLE-Client: Setting bottom color failed: {e}")
-                await self._disconnect_internal()
-                raise
+        await self.set_light_state(ble_device, bottom_color=color_percentage)
 
     async def set_both_lights_color(self, ble_device: BLEDevice, top_color_percentage: int, bottom_color_percentage: int) -> None:
         """Sets the color of both lights simultaneously (0-100%, 0=6500K, 100=2700K)."""
         if not 0 <= top_color_percentage <= 100 or not 0 <= bottom_color_percentage <= 100:
             raise ValueError("Color values must be between 0 and 100")
-
-        top_color_value = int(top_color_percentage * 255 / 100)
-        bottom_color_value = int(bottom_color_percentage * 255 / 100)
-
-        async with self._connection_lock:
-            try:
-                client = await self._ensure_connection(ble_device)
-
-                # Read current color values
-                current_colors = await client.read_gatt_char(READ_WRITE_LIGHT_COLOR)
-                new_colors = bytearray(current_colors)
-                if len(new_colors) > max(COLOR_BOTTOM_BYTE, COLOR_TOP_BYTE):
-                    new_colors[COLOR_BOTTOM_BYTE] = bottom_color_value
-                    new_colors[COLOR_TOP_BYTE] = top_color_value
-
-                await client.write_gatt_char(READ_WRITE_LIGHT_COLOR, bytes(new_colors))
-
-                self.logger.info(f"Both light colors set: top {top_color_percentage}%, bottom {bottom_color_percentage}%")
-
-            except Exception as e:
-                self.logger.error(f"BLE-Client: Setting both colors failed: {e}")
-                await self._disconnect_internal()
-                raise
+        await self.set_light_state(
+            ble_device, top_color=top_color_percentage, bottom_color=bottom_color_percentage
+        )
 
     # === FAN CONTROL ===
 
     async def set_fan_level(self, ble_device: BLEDevice, level: int) -> None:
         """Sets the fan level (0=off, 1-3)."""
-        self.logger.info(f"BLE-Client: set_fan_level called - Level: {level}, Device: {ble_device.address}")
+        self.logger.info("BLE-Client: set_fan_level called - Level: %s, Device: %s", level, ble_device.address)
 
         if not 0 <= level <= 3:
             raise ValueError("Fan level must be between 0 and 3")
@@ -672,44 +788,46 @@ class BerbelBluetoothDeviceData:
         }
 
         if self._legacy_mode:
-            async with self._connection_lock:
+            async with self._lock_for(ble_device.address):
                 client = await self._ensure_connection(ble_device)
                 sender = LegacyCommandSender()
                 await sender.fan_level(client, level)
                 return
         command = command_map[level]
-        self.logger.debug(f"BLE-Client: Fan command generated: {command.hex()}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("BLE-Client: Fan command generated: %s", command.hex())
         await self._execute_command(ble_device, command)
 
     # === CONVENIENCE METHODS ===
 
-    async def turn_light_top_on(self, ble_device: BLEDevice) -> None:
+    # Thin aliases return the setter's coroutine directly instead of awaiting it
+    def turn_light_top_on(self, ble_device: BLEDevice) -> Coroutine[Any, Any, None]:
         """Turns the top light on."""
-        await self.set_light_top_on(ble_device, True)
+        return self.set_light_top_on(ble_device, True)
 
-    async def turn_light_top_off(self, ble_device: BLEDevice) -> None:
+    def turn_light_top_off(self, ble_device: BLEDevice) -> Coroutine[Any, Any, None]:
         """Turns the top light off."""
-        await self.set_light_top_on(ble_device, False)
+        return self.set_light_top_on(ble_device, False)
 
-    async def turn_light_bottom_on(self, ble_device: BLEDevice) -> None:
+    def turn_light_bottom_on(self, ble_device: BLEDevice) -> Coroutine[Any, Any, None]:
         """Turns the bottom light on."""
-        await self.set_light_bottom_on(ble_device, True)
+        return self.set_light_bottom_on(ble_device, True)
 
-    async def turn_light_bottom_off(self, ble_device: BLEDevice) -> None:
+    def turn_light_bottom_off(self, ble_device: BLEDevice) -> Coroutine[Any, Any, None]:
         """Turns the bottom light off."""
-        await self.set_light_bottom_on(ble_device, False)
+        return self.set_light_bottom_on(ble_device, False)
 
-    async def turn_both_lights_on(self, ble_device: BLEDevice) -> None:
+    def turn_both_lights_on(self, ble_device: BLEDevice) -> Coroutine[Any, Any, None]:
         """Turns both lights on."""
-        await self.set_both_lights_on(ble_device, True)
+        return self.set_both_lights_on(ble_device, True)
 
-    async def turn_both_lights_off(self, ble_device: BLEDevice) -> None:
+    def turn_both_lights_off(self, ble_device: BLEDevice) -> Coroutine[Any, Any, None]:
         """Turns both lights off."""
-        await self.set_both_lights_on(ble_device, False)
+        return self.set_both_lights_on(ble_device, False)
 
-    async def turn_fan_off(self, ble_device: BLEDevice) -> None:
+    def turn_fan_off(self, ble_device: BLEDevice) -> Coroutine[Any, Any, None]:
         """Turns the fan off."""
-        await self.set_fan_level(ble_device, 0)
+        return self.set_fan_level(ble_device, 0)
 
     # === KELVIN HELPERS ===
 
@@ -719,7 +837,7 @@ class BerbelBluetoothDeviceData:
             raise ValueError(f"Kelvin must be between {MIN_KELVIN} and {MAX_KELVIN}")
 
         # Convert Kelvin to percentage (2700K = 100%, 6500K = 0%)
-        percentage = int(100 * (MAX_KELVIN - kelvin) / (MAX_KELVIN - MIN_KELVIN))
+        percentage = _KELVIN_TO_PCT[int(kelvin)]
         await self.set_light_top_color(ble_device, percentage)
 
     async def set_light_bottom_color_kelvin(self, ble_device: BLEDevice, kelvin: int) -> None:
@@ -728,7 +846,7 @@ class BerbelBluetoothDeviceData:
             raise ValueError(f"Kelvin must be between {MIN_KELVIN} and {MAX_KELVIN}")
 
         # Convert Kelvin to percentage (2700K = 100%, 6500K = 0%)
-        percentage = int(100 * (MAX_KELVIN - kelvin) / (MAX_KELVIN - MIN_KELVIN))
+        percentage = _KELVIN_TO_PCT[int(kelvin)]
         await self.set_light_bottom_color(ble_device, percentage)
 
     async def set_both_lights_color_kelvin(self, ble_device: BLEDevice, top_kelvin: int, bottom_kelvin: int) -> None:
@@ -739,8 +857,8 @@ class BerbelBluetoothDeviceData:
             raise ValueError(f"Bottom Kelvin must be between {MIN_KELVIN} and {MAX_KELVIN}")
 
         # Convert Kelvin to percentage
-        top_percentage = int(100 * (MAX_KELVIN - top_kelvin) / (MAX_KELVIN - MIN_KELVIN))
-        bottom_percentage = int(100 * (MAX_KELVIN - bottom_kelvin) / (MAX_KELVIN - MIN_KELVIN))
+        top_percentage = _KELVIN_TO_PCT[int(top_kelvin)]
+        bottom_percentage = _KELVIN_TO_PCT[int(bottom_kelvin)]
 
         await self.set_both_lights_color(ble_device, top_percentage, bottom_percentage)
 
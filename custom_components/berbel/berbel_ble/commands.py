@@ -3,6 +3,36 @@
 from .const import *
 
 
+def validate_command_length(command: bytes) -> None:
+    """
+    Validates the command length.
+    
+    Args:
+        command: The command to validate
+        
+    Raises:
+        ValueError: If the command is not 31 bytes long
+    """
+    if len(command) != 31:
+        raise ValueError(f"Command must be 31 bytes long, but is {len(command)} bytes")
+
+
+class ValidatedCommand(bytes):
+    """Command bytes whose length was checked when the object was created."""
+
+    __slots__ = ()
+
+    def __new__(cls, command: bytes) -> "ValidatedCommand":
+        validate_command_length(command)
+        return super().__new__(cls, command)
+
+
+# Basis-Kommando: 01630000BBTT00000000000000000000000000000000000000000000000000 (31 Bytes)
+_LIGHT_COMMAND_PREFIX = bytes.fromhex("01630000")
+_LIGHT_COMMAND_SUFFIX = bytes(25)
+_LIGHT_COMMAND_EMPTY = ValidatedCommand(_LIGHT_COMMAND_PREFIX + bytes(2) + _LIGHT_COMMAND_SUFFIX)
+
+
 def create_light_brightness_command(top_brightness: int = None, bottom_brightness: int = None) -> bytes:
     """
     Creates a command for the light brightness.
@@ -12,22 +42,30 @@ def create_light_brightness_command(top_brightness: int = None, bottom_brightnes
         bottom_brightness: Brightness of the bottom light (0-255, None = do not change)
     
     Returns:
-        31-Byte-Command for the light control
+        31-Byte-Command for the light control (a ValidatedCommand)
     """
-    # Basis-Kommando: 01630000TTBB00000000000000000000000000000000000000000000000000 (31 Bytes)
-    command = bytearray.fromhex("01630000000000000000000000000000000000000000000000000000000000")
-    
+    if top_brightness is None and bottom_brightness is None:
+        return _LIGHT_COMMAND_EMPTY
+
     if top_brightness is not None:
         if not 0 <= top_brightness <= 255:
             raise ValueError("top_brightness must be between 0 and 255")
-        command[5] = top_brightness  # Position for the top light
     
     if bottom_brightness is not None:
         if not 0 <= bottom_brightness <= 255:
             raise ValueError("bottom_brightness must be between 0 and 255")  
-        command[4] = bottom_brightness  # Position for the bottom light
     
-    return bytes(command)
+    # Byte 4 = bottom light, byte 5 = top light
+    return ValidatedCommand(
+        _LIGHT_COMMAND_PREFIX
+        + bytes((bottom_brightness or 0, top_brightness or 0))
+        + _LIGHT_COMMAND_SUFFIX
+    )
+
+
+# Percentage -> brightness byte, precomputed with the historical int(p * 2.55)
+# (which maps 100% to 254)
+_PERCENT_TO_BYTE = tuple(int(p * 2.55) for p in range(101))
 
 
 def create_light_brightness_command_from_percentage(top_percentage: int = None, bottom_percentage: int = None) -> bytes:
@@ -47,16 +85,20 @@ def create_light_brightness_command_from_percentage(top_percentage: int = None,
     if top_percentage is not None:
         if not 0 <= top_percentage <= 100:
             raise ValueError("top_percentage must be between 0 and 100")
-        top_brightness = int(top_percentage * 2.55)
+        top_brightness = _PERCENT_TO_BYTE[top_percentage]
     
     if bottom_percentage is not None:
         if not 0 <= bottom_percentage <= 100:
             raise ValueError("bottom_percentage must be between 0 and 100")
-        bottom_brightness = int(bottom_percentage * 2.55)
+        bottom_brightness = _PERCENT_TO_BYTE[bottom_percentage]
     
     return create_light_brightness_command(top_brightness, bottom_brightness)
 
 
+# Fan commands indexed by level
+_FAN_COMMANDS = (CMD_FAN_OFF, CMD_FAN_LEVEL_1, CMD_FAN_LEVEL_2, CMD_FAN_LEVEL_3)
+
+
 def create_fan_command(level: int) -> bytes:
     """
     Creates a command for the fan control.
@@ -70,46 +112,25 @@ def create_fan_command(level: int) -> bytes:
     if not 0 <= level <= 3:
         raise ValueError("level must be between 0 and 3")
     
-    if level == 0:
-        return CMD_FAN_OFF
-    elif level == 1:
-        return CMD_FAN_LEVEL_1
-    elif level == 2:
-        return CMD_FAN_LEVEL_2
-    elif level == 3:
-        return CMD_FAN_LEVEL_3
+    return _FAN_COMMANDS[level]
 
 
 # Predefined commands for easy use
 class LightCommands:
     """Collection of all light commands."""
     
-    TOP_ON = CMD_LIGHT_TOP_ON
-    TOP_OFF = CMD_LIGHT_TOP_OFF
-    BOTTOM_ON = CMD_LIGHT_BOTTOM_ON
-    BOTTOM_OFF = CMD_LIGHT_BOTTOM_OFF
-    BOTH_ON = CMD_BOTH_LIGHTS_ON
-    BOTH_OFF = CMD_BOTH_LIGHTS_OFF
+    TOP_ON = ValidatedCommand(CMD_LIGHT_TOP_ON)
+    TOP_OFF = ValidatedCommand(CMD_LIGHT_TOP_OFF)
+    BOTTOM_ON = ValidatedCommand(CMD_LIGHT_BOTTOM_ON)
+    BOTTOM_OFF = ValidatedCommand(CMD_LIGHT_BOTTOM_OFF)
+    BOTH_ON = ValidatedCommand(CMD_BOTH_LIGHTS_ON)
+    BOTH_OFF = ValidatedCommand(CMD_BOTH_LIGHTS_OFF)
 
 
 class FanCommands:
     """Collection of all fan commands."""
     
-    OFF = CMD_FAN_OFF
-    LEVEL_1 = CMD_FAN_LEVEL_1
-    LEVEL_2 = CMD_FAN_LEVEL_2
-    LEVEL_3 = CMD_FAN_LEVEL_3
-
-
-def validate_command_length(command: bytes) -> None:
-    """
-    Validates the command length.
-    
-    Args:
-        command: The command to validate
-        
-    Raises:
-        ValueError: If the command is not 31 bytes long
-    """
-    if len(command) != 31:
-        raise ValueError(f"Command must be 31 bytes long, but is {len(command)} bytes") 
\ No newline at end of file
+    OFF = ValidatedCommand(CMD_FAN_OFF)
+    LEVEL_1 = ValidatedCommand(CMD_FAN_LEVEL_1)
+    LEVEL_2 = ValidatedCommand(CMD_FAN_LEVEL_2)
+    LEVEL_3 = ValidatedCommand(CMD_FAN_LEVEL_3)
@@ -4,8 +4,11 @@ Builds URL-encoded ASCII commands with PIN prefix and writes to RX characteristi
 """
 from __future__ import annotations
 import asyncio
+import functools
 import logging
+import re
 import urllib.parse
+import weakref
 from typing import Optional
 from bleak import BleakClient
 
@@ -17,6 +20,21 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_LEGACY_UUID_RX_2018_LC = LEGACY_UUID_RX_2018.lower()
+
+# Characters urllib.parse.quote(..., safe="") leaves untouched
+_UNRESERVED_RE = re.compile(r"[A-Za-z0-9_.~-]*")
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_payload(pin: str, command: str) -> bytes:
+    """Returns the URL-encoded PIN + command payload (cached per pin/command)."""
+    s = f"{pin}{command}"
+    if _UNRESERVED_RE.fullmatch(s):
+        # Nothing to escape, quote() would return the string unchanged
+        return s.encode("ascii")
+    return urllib.parse.quote(s, safe="").encode("utf-8")
+
 
 class LegacyCommandSender:
     """Helper to send commands to legacy devices via RX characteristic.
@@ -27,18 +45,25 @@ class LegacyCommandSender:
     def __init__(self, pin: str | None = None):
         self.pin = pin or LEGACY_DEFAULT_PIN
 
-    @staticmethod
-    def _rx_uuid_for_device(client: BleakClient) -> str:
+    # Resolved RX UUID per connected client; entries go away with the client
+    _rx_cache: "weakref.WeakKeyDictionary[BleakClient, str]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def _rx_uuid_for_device(cls, client: BleakClient) -> str:
+        cached = cls._rx_cache.get(client)
+        if cached is not None:
+            return cached
         # Try 2018 first as it is more recent, fall back to legacy
-        services = [s.uuid.lower() for s in client.services]
-        if LEGACY_UUID_RX_2018.lower() in services:
-            return LEGACY_UUID_RX_2018
-        return LEGACY_UUID_RX
+        if any(s.uuid.lower() == _LEGACY_UUID_RX_2018_LC for s in client.services):
+            uuid = LEGACY_UUID_RX_2018
+        else:
+            uuid = LEGACY_UUID_RX
+        cls._rx_cache[client] = uuid
+        return uuid
 
     def _encode(self, command: str) -> bytes:
         # Concatenate PIN and command text then URL-encode as in the app
-        s = f"{self.pin}{command}"
-        return urllib.parse.quote(s, safe="").encode("utf-8")
+        return _encode_payload(self.pin, command)
 
     async def send(self, client: BleakClient, command: str) -> None:
         uuid = self._rx_uuid_for_device(client)
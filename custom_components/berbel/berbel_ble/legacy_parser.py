@@ -9,19 +9,10 @@ from typing import Dict, Optional, Union
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def _nibble(hex_str: str, start: int) -> int:
-    """Returns integer value of one hex nibble (single hex char)."""
-    if len(hex_str) <= start:
-        return 0
-    return int(hex_str[start:start+1], 16)
-
-
-def _byte(hex_str: str, start: int) -> int:
-    """Returns integer value of one hex byte (two hex chars)."""
-    if len(hex_str) <= start+1:
-        return 0
-    return int(hex_str[start:start+2], 16)
+# Nibble value -> (bit0, bit1, bit2, bit3) as bools
+_NIBBLE_BITS = tuple(
+    ((n & 1) != 0, (n & 2) != 0, (n & 4) != 0, (n & 8) != 0) for n in range(16)
+)
 
 
 def parse_legacy_manufacturer_data(manufacturer_data: Union[bytes, str]) -> Optional[Dict]:
@@ -42,61 +33,53 @@ def parse_legacy_manufacturer_data(manufacturer_data: Union[bytes, str]) -> Opti
       - brightness/color percentages are unknown from advertisement => 0
     """
     try:
-        if isinstance(manufacturer_data, bytes):
-            hex_str = manufacturer_data.hex()
+        if isinstance(manufacturer_data, str):
+            hex_str = manufacturer_data.replace(" ", "")
+            if len(hex_str) < 18:  # need at least up to index 17 nibble
+                return None
+            if len(hex_str) & 1:
+                # A missing trailing nibble reads as 0, as in the per-nibble parse
+                hex_str += "0"
+            # bytes.fromhex decodes in C; no per-nibble int() calls
+            raw = bytes.fromhex(hex_str)
         else:
-            hex_str = manufacturer_data.replace(" ", "").lower()
+            raw = manufacturer_data
+        mv = memoryview(raw)
 
-        if len(hex_str) < 18:  # need at least up to index 17 nibble
+        if len(mv) < 9:  # need at least up to hex index 17 (byte 8)
             return None
 
-        # Fan level (0-3 typical)
-        fan_level = _byte(hex_str, 12)
+        # Fan level (0-3 typical), hex[12:14] = byte 6
+        fan_level = mv[6]
         if fan_level > 3:
             # some firmwares may report 4 for intensive; cap to 3 for HA range
             fan_level = 3
 
-        # Nibble groups
-        n14 = _nibble(hex_str, 14)
-        n15 = _nibble(hex_str, 15)
-        n16 = _nibble(hex_str, 16)
-        n17 = _nibble(hex_str, 17)
-        # n18-19 is kennlinie (unused here)
-        # feature nibbles
-        n22 = _nibble(hex_str, 22)
-        n23 = _nibble(hex_str, 23)
-
-        # Flags per Hood.java mapping
-        hasActiveIllumination = bool(n17 & 0b0001)
-        hasActiveTrailing = bool(n17 & 0b0010)
-        hasActiveCirculation = bool(n17 & 0b0100)
-        hasActiveLiftUp = bool(n17 & 0b1000)
-
-        hasActiveLiftDown = bool(n16 & 0b0001)
-        hasActiveEffect = bool(n16 & 0b0010)
-        hasActiveRGB = bool(n16 & 0b0100)
-        hasFatFilterSaturation = bool(n16 & 0b1000)
-
-        hasCoalFilterSaturation = bool(n15 & 0b0001)
-        hasAutomatic = bool(n15 & 0b1000)
-        hasActiveAutoRunReset = bool(n14 & 0b0001)
-
-        hasEffectLight = bool(n23 & 0b0001)
-        hasCirculation = bool(n23 & 0b0010)
-        hasRGB = bool(n23 & 0b0100)
-        hasLift = bool(n23 & 0b1000)
-
-        hasDimmer = bool(n22 & 0b0010)
-        hasAutoTrailing = bool(n22 & 0b0100)
-        hasIntensive = bool(n22 & 0b1000)
+        # Nibble groups: hex index n is the high nibble of byte n >> 1 if n is
+        # even, the low nibble otherwise. Flags per Hood.java mapping (bit 0..3):
+        #   n14: activeAutoRunReset, -, -, -
+        #   n15: coalFilterSaturation, -, -, automatic
+        #   n16: activeLiftDown, activeEffect, activeRGB, fatFilterSaturation
+        #   n17: activeIllumination, activeTrailing, activeCirculation, activeLiftUp
+        #   n18-19: kennlinie
+        #   n22: -, dimmer, autoTrailing, intensive
+        #   n23: effectLight, circulation, RGB, lift
+        # Only the flags mapped to BerbelDevice fields (or logged) are decoded.
+        b7 = mv[7]
+        b8 = mv[8]
+        hasAutomatic = _NIBBLE_BITS[b7 & 0xF][3]  # n15
+        hasActiveIllumination, hasActiveTrailing = _NIBBLE_BITS[b8 & 0xF][:2]  # n17
+        # feature nibble n23 (byte 11, absent in short advertisements)
+        hasEffectLight = len(mv) > 11 and _NIBBLE_BITS[mv[11] & 0xF][0]
+        light_on = hasActiveIllumination or hasEffectLight
 
         # Map to BerbelDevice fields
         data = {
             "fan_level": fan_level,
             "fan_postrun_active": hasActiveTrailing,
             # We do not know split top/bottom from broadcast; assume illumination -> both on
-            "light_top_on": hasActiveIllumination or hasEffectLight,
-            "light_bottom_on": hasActiveIllumination or hasEffectLight,
+            "light_top_on": light_on,
+            "light_bottom_on": light_on,
             "light_top_brightness": 0,
             "light_bottom_brightness": 0,
             "light_top_color": 0,
@@ -1,6 +1,6 @@
 """Legacy state reading for older Berbel models (HOOD_PER).
 
-Provides helpers to read TX/CF characteristics and parse ASCII payloads
+Provides helpers to read the TX characteristic and parse its ASCII payload
 based on template/sources/com/cybob/wescoremote/utils/Hood.java::evaluateResponse.
 """
 from __future__ import annotations
@@ -8,24 +8,19 @@ import logging
 from typing import Dict, Optional
 from bleak import BleakClient
 
-from .const import (
-    LEGACY_UUID_TX,
-    LEGACY_UUID_KONFIG,
-)
+from .const import LEGACY_UUID_TX
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def _safe_decode_ascii(data: bytes) -> str:
-    try:
-        return bytes(data).decode("utf-8", errors="ignore")
-    except Exception:
-        return ""
+# ASCII codes of the TX flag characters
+_ASCII_ZERO = ord("0")
+_FLAG_ILLUMINATION = ord("L")
+_FLAG_TRAILING = ord("N")
 
 
-def _parse_tx_ascii(s: str) -> Dict:
-    """Parse TX ASCII as in Hood.evaluateResponse for TX.
-    Java logic:
+def _parse_tx_bytes(data: bytes) -> Dict:
+    """Parse the raw TX payload as in Hood.evaluateResponse for TX.
+    Java logic (indices into the ASCII response):
       stufe = int(hexToString.substring(4, 5))
       hasActiveIllumination = substring(5,6) == 'L'
       hasActiveTrailing = substring(6,7) == 'N'
@@ -38,6 +33,7 @@ def _parse_tx_ascii(s: str) -> Dict:
       hasCoalFilterSaturation = substring(12,13) == 'K'
       hasAutomatic = substring(14,15) == 'A'
     We only need fan level, illumination and postrun (Nachlauf N) mapping.
+    The response is plain ASCII, so the bytes are compared without decoding.
     """
     result = {
         "fan_level": 0,
@@ -45,69 +41,45 @@ def _parse_tx_ascii(s: str) -> Dict:
         "light_top_on": False,
         "light_bottom_on": False,
     }
-    if len(s) < 15:
+    if len(data) < 15:
         return result
-    # Fan level at index 4 (single char number)
-    try:
-        level_char = s[4:5]
-        result["fan_level"] = max(0, min(3, int(level_char)))
-    except Exception:
-        pass
+    # Fan level at index 4 (single ASCII digit)
+    level = data[4] - _ASCII_ZERO
+    if 0 <= level <= 9:
+        result["fan_level"] = min(3, level)
     # Illumination flag 'L' at index 5
-    illum = s[5:6] == "L"
+    illum = data[5] == _FLAG_ILLUMINATION
     result["light_top_on"] = illum
     result["light_bottom_on"] = illum
     # Postrun 'N' at index 6
-    result["fan_postrun_active"] = s[6:7] == "N"
+    result["fan_postrun_active"] = data[6] == _FLAG_TRAILING
     return result
 
 
-def _parse_cf_ascii(s: str) -> Dict:
-    """Parse CF ASCII. We currently do not map additional fields to HA state.
-    Java indicates feature availability; we can ignore for runtime state.
-    """
-    return {}
+async def _safe_read(client: BleakClient, uuid: str, label: str) -> Optional[bytes]:
+    """Read a characteristic, returning None if it is missing or the read fails."""
+    try:
+        return await client.read_gatt_char(uuid)
+    except Exception as e:
+        _LOGGER.debug("Legacy %s read failed: %s", label, e)
+        return None
 
 
 async def read_legacy_state_via_gatt(client: BleakClient) -> Optional[Dict]:
-    """Read legacy state via TX/CF characteristics and parse ASCII.
+    """Read legacy state via the TX characteristic and parse its ASCII payload.
 
     Returns a dict compatible with BerbelDevice or None if not available.
     The function is best-effort and should be used as fallback when
     advertisement manufacturer data is not present.
     """
     try:
-        # Some devices may not expose services until accessed; ensure services resolved
-        try:
-            await client.get_services()
-        except Exception:
-            pass
-
-        tx_data: Optional[bytes] = None
-        cf_data: Optional[bytes] = None
-        # Read TX (if present)
-        try:
-            tx_data = await client.read_gatt_char(LEGACY_UUID_TX)
-        except Exception as e:
-            _LOGGER.debug("Legacy TX read failed: %s", e)
-        # Read CF (optional)
-        try:
-            cf_data = await client.read_gatt_char(LEGACY_UUID_KONFIG)
-        except Exception as e:
-            _LOGGER.debug("Legacy CF read failed: %s", e)
-
-        if tx_data is None and cf_data is None:
+        # Services are resolved on connect. CF (LEGACY_UUID_KONFIG) only
+        # describes features and maps to no state field, so it is not read.
+        tx_data = await _safe_read(client, LEGACY_UUID_TX, "TX")
+        if tx_data is None:
             return None
 
-        result: Dict = {}
-        if tx_data is not None:
-            tx_str = _safe_decode_ascii(tx_data)
-            parsed_tx = _parse_tx_ascii(tx_str)
-            result.update(parsed_tx)
-        if cf_data is not None:
-            cf_str = _safe_decode_ascii(cf_data)
-            parsed_cf = _parse_cf_ascii(cf_str)
-            result.update(parsed_cf)
+        result: Dict = _parse_tx_bytes(tx_data)
 
         # Fill brightness/color unknowns explicitly
         if "light_top_brightness" not in result:
@@ -4,10 +4,25 @@ from __future__ import annotations
 import dataclasses
 from .const import MAX_KELVIN, MIN_KELVIN
 
+_set = object.__setattr__
 
-@dataclasses.dataclass
+# Kelvin per color percent
+_KELVIN_SCALE = (MAX_KELVIN - MIN_KELVIN) / 100.0
+
+
+def kelvin_to_color_percentage(kelvin: int) -> int:
+    """Converts a color temperature in Kelvin to the device's color percentage."""
+    # 2700K = 100%, 6500K = 0%
+    return int(100 * (MAX_KELVIN - kelvin) / (MAX_KELVIN - MIN_KELVIN))
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
 class BerbelDevice:
-    """Response data with information about the Berbel device"""
+    """Response data with information about the Berbel device
+
+    Frozen, so a snapshot held by the coordinator cannot change under its
+    equality check; derive changed copies with dataclasses.replace.
+    """
 
     name: str = ""
     address: str = ""
@@ -22,22 +37,29 @@ class BerbelDevice:
 
     def __post_init__(self):
         """Validates the values after initialization."""
-        self.light_top_brightness = max(0, min(100, self.light_top_brightness))
-        self.light_bottom_brightness = max(0, min(100, self.light_bottom_brightness))
-        self.light_top_color = max(0, min(100, self.light_top_color))
-        self.light_bottom_color = max(0, min(100, self.light_bottom_color))
-        self.fan_level = max(0, min(4, self.fan_level))
+        # Values are almost always in range already, so only assign when
+        # clamping (through object.__setattr__, the instance is frozen)
+        if not 0 <= self.light_top_brightness <= 100:
+            _set(self, "light_top_brightness", 0 if self.light_top_brightness < 0 else 100)
+        if not 0 <= self.light_bottom_brightness <= 100:
+            _set(self, "light_bottom_brightness", 0 if self.light_bottom_brightness < 0 else 100)
+        if not 0 <= self.light_top_color <= 100:
+            _set(self, "light_top_color", 0 if self.light_top_color < 0 else 100)
+        if not 0 <= self.light_bottom_color <= 100:
+            _set(self, "light_bottom_color", 0 if self.light_bottom_color < 0 else 100)
+        if not 0 <= self.fan_level <= 4:
+            _set(self, "fan_level", 0 if self.fan_level < 0 else 4)
 
     @property
     def light_top_color_kelvin(self) -> int:
         """Converts the top light color from percentage to Kelvin."""
         # 0% = 6500K, 100% = 2700K, linear dazwischen
-        return int(round(MAX_KELVIN - (self.light_top_color / 100) * (MAX_KELVIN - MIN_KELVIN)))
+        return int(MAX_KELVIN - self.light_top_color * _KELVIN_SCALE + 0.5)
 
     @property
     def light_bottom_color_kelvin(self) -> int:
         """Converts the bottom light color from percentage to Kelvin."""
-        return int(round(MAX_KELVIN - (self.light_bottom_color / 100) * (MAX_KELVIN - MIN_KELVIN)))
+        return int(MAX_KELVIN - self.light_bottom_color * _KELVIN_SCALE + 0.5)
 
     def __str__(self) -> str:
         """User-friendly string representation."""
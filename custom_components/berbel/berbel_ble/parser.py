@@ -21,99 +21,146 @@ COLOR_BOTTOM_BYTE = 6
 COLOR_TOP_BYTE = 7
 
 
+def _build_fan_level_lut() -> bytes:
+    """Maps every value of the fan level 2-4 byte to its fan level (0 = none)."""
+    lut = bytearray(256)
+    # Assigned in reverse so the lower level wins if two constants coincide
+    lut[FAN_LEVEL_4] = 4
+    lut[FAN_LEVEL_3] = 3
+    lut[FAN_LEVEL_2] = 2
+    return bytes(lut)
+
+
+_FAN_LEVEL_LUT = _build_fan_level_lut()
+
+# (status, brightness, colors, result) of the last parse_status call
+_last_parse: tuple[bytes, bytes, bytes, dict] | None = None
+
+
+# Byte-Layout:
+# Status:
+# - Byte 0: Fan Level 1 (0x10)
+# - Byte 1: Fan Level 2-4 (0x10, 0x18, 0x19)
+# - Byte 2: Light Top Status (0x10)
+# - Byte 4: Light Bottom Status (0x10)
+# - Byte 5: Postrun Status (0x90)
+#
+# Brightness:
+# - Byte 4: Bottom Light Brightness (0-255)
+# - Byte 5: Top Light Brightness (0-255)
+#
+# Colors:
+# - Byte 6: Bottom Light Color (0-255)
+# - Byte 7: Top Light Color (0-255)
+
+
+def parse_light_status(status: bytes) -> tuple[bool, bool]:
+    """Parses the light status from the status bytes."""
+    light_top_on = (status[STATUS_LIGHT_TOP_BYTE] & LIGHT_ON_MASK) != 0
+    light_bottom_on = (status[STATUS_LIGHT_BOTTOM_BYTE] & LIGHT_ON_MASK) != 0
+    return light_top_on, light_bottom_on
+
+
+def parse_fan_level(status: bytes) -> int:
+    """Parses the fan level from the status bytes."""
+    if status[STATUS_FAN_LEVEL_1_BYTE] == FAN_LEVEL_1:
+        return 1
+    return _FAN_LEVEL_LUT[status[STATUS_FAN_LEVEL_2_4_BYTE]]
+
+
+def parse_postrun_status(status: bytes) -> bool:
+    """Parses the postrun status from the status bytes."""
+    return (status[STATUS_POSTRUN_BYTE] & POSTRUN_MASK) == POSTRUN_MASK
+
+
+def parse_brightness(brightness: bytes) -> tuple[int, int]:
+    """Parses the brightness values (bottom, top) from the brightness bytes."""
+    # Integer scaling, identical to int(value / 255 * 100) for all bytes
+    if len(brightness) > BRIGHTNESS_TOP_BYTE:
+        return (
+            brightness[BRIGHTNESS_BOTTOM_BYTE] * 100 // 255,
+            brightness[BRIGHTNESS_TOP_BYTE] * 100 // 255,
+        )
+    return 0, 0
+
+
+def parse_colors(colors: bytes) -> tuple[int, int]:
+    """Parses the color values (bottom, top) from the colors bytes."""
+    if len(colors) > COLOR_TOP_BYTE:
+        return (
+            colors[COLOR_BOTTOM_BYTE] * 100 // 255,
+            colors[COLOR_TOP_BYTE] * 100 // 255,
+        )
+    return 0, 0
+
+
+def parse_status(
+    status: bytes,
+    brightness: bytes,
+    colors: bytes,
+    _light_on_mask: int = LIGHT_ON_MASK,
+    _postrun_mask: int = POSTRUN_MASK,
+    _fan_level_1: int = FAN_LEVEL_1,
+    _fan_level_lut: bytes = _FAN_LEVEL_LUT,
+) -> dict:
+    """Parses all status data from the BLE bytes.
+
+    The per-field helpers above are inlined here since this runs for every
+    status read; the trailing arguments only bind constants locally. If the
+    payloads equal those of the previous call, the previous dict is returned
+    again, so callers must not modify the result.
+    """
+    global _last_parse
+    last = _last_parse
+    if (
+        last is not None
+        and status == last[0]
+        and brightness == last[1]
+        and colors == last[2]
+    ):
+        return last[3]
+
+    has_brightness = len(brightness) > BRIGHTNESS_TOP_BYTE
+    has_colors = len(colors) > COLOR_TOP_BYTE
+    result = {
+        "light_top_on": (status[STATUS_LIGHT_TOP_BYTE] & _light_on_mask) != 0,
+        "light_bottom_on": (status[STATUS_LIGHT_BOTTOM_BYTE] & _light_on_mask) != 0,
+        "light_top_brightness": brightness[BRIGHTNESS_TOP_BYTE] * 100 // 255 if has_brightness else 0,
+        "light_bottom_brightness": brightness[BRIGHTNESS_BOTTOM_BYTE] * 100 // 255 if has_brightness else 0,
+        "light_top_color": colors[COLOR_TOP_BYTE] * 100 // 255 if has_colors else 0,
+        "light_bottom_color": colors[COLOR_BOTTOM_BYTE] * 100 // 255 if has_colors else 0,
+        "fan_level": (
+            1 if status[STATUS_FAN_LEVEL_1_BYTE] == _fan_level_1
+            else _fan_level_lut[status[STATUS_FAN_LEVEL_2_4_BYTE]]
+        ),
+        "fan_postrun_active": (status[STATUS_POSTRUN_BYTE] & _postrun_mask) == _postrun_mask,
+    }
+    # bleak hands out bytearrays; keep immutable copies for the comparison
+    _last_parse = (bytes(status), bytes(brightness), bytes(colors), result)
+    return result
+
+
+def create_device_from_data(name: str, address: str, data: dict) -> BerbelDevice:
+    """Creates a BerbelDevice from parsed data."""
+    return BerbelDevice(
+        name=name,
+        address=address,
+        **data
+    )
+
+
 class BerbelBluetoothDeviceParser:
     """
     Helper class to parse BLE status data.
-    
-    Byte-Layout:
-    Status:
-    - Byte 0: Fan Level 1 (0x10)
-    - Byte 1: Fan Level 2-4 (0x10, 0x18, 0x19)
-    - Byte 2: Light Top Status (0x10)
-    - Byte 4: Light Bottom Status (0x10)
-    - Byte 5: Postrun Status (0x90)
-    
-    Brightness:
-    - Byte 4: Bottom Light Brightness (0-255)
-    - Byte 5: Top Light Brightness (0-255)
-    
-    Colors:
-    - Byte 6: Bottom Light Color (0-255)
-    - Byte 7: Top Light Color (0-255)
+
+    Kept for compatibility; the parsing itself lives in the module-level
+    functions (see the byte layout above).
     """
 
-    @staticmethod
-    def _parse_light_status(status: bytes) -> tuple[bool, bool]:
-        """Parses the light status from the status bytes."""
-        light_top_on = (status[STATUS_LIGHT_TOP_BYTE] & LIGHT_ON_MASK) != 0
-        light_bottom_on = (status[STATUS_LIGHT_BOTTOM_BYTE] & LIGHT_ON_MASK) != 0
-        return light_top_on, light_bottom_on
-
-    @staticmethod
-    def _parse_fan_level(status: bytes) -> int:
-        """Parses the fan level from the status bytes."""
-        if status[STATUS_FAN_LEVEL_1_BYTE] == FAN_LEVEL_1:
-            return 1
-        elif status[STATUS_FAN_LEVEL_2_4_BYTE] == FAN_LEVEL_2:
-            return 2
-        elif status[STATUS_FAN_LEVEL_2_4_BYTE] == FAN_LEVEL_3:
-            return 3
-        elif status[STATUS_FAN_LEVEL_2_4_BYTE] == FAN_LEVEL_4:
-            return 4
-        return 0
-
-    @staticmethod
-    def _parse_postrun_status(status: bytes) -> bool:
-        """Parses the postrun status from the status bytes."""
-        return (status[STATUS_POSTRUN_BYTE] & POSTRUN_MASK) == POSTRUN_MASK
-
-    @staticmethod
-    def _parse_brightness(brightness: bytes) -> tuple[int, int]:
-        """Parses the brightness values from the brightness bytes."""
-        if len(brightness) >= max(BRIGHTNESS_BOTTOM_BYTE, BRIGHTNESS_TOP_BYTE) + 1:
-            light_bottom_brightness = int(brightness[BRIGHTNESS_BOTTOM_BYTE] / 255 * 100)
-            light_top_brightness = int(brightness[BRIGHTNESS_TOP_BYTE] / 255 * 100)
-        else:
-            light_bottom_brightness = 0
-            light_top_brightness = 0
-        return light_bottom_brightness, light_top_brightness
-
-    @staticmethod
-    def _parse_colors(colors: bytes) -> tuple[int, int]:
-        """Parses the color values from the colors bytes."""
-        if len(colors) >= max(COLOR_BOTTOM_BYTE, COLOR_TOP_BYTE) + 1:
-            light_bottom_color = int(colors[COLOR_BOTTOM_BYTE] / 255 * 100)
-            light_top_color = int(colors[COLOR_TOP_BYTE] / 255 * 100)
-        else:
-            light_bottom_color = 0
-            light_top_color = 0
-        return light_bottom_color, light_top_color
-
-    @staticmethod
-    def parse_status(status: bytes, brightness: bytes, colors: bytes) -> dict:
-        """Parses all status data from the BLE bytes."""
-        light_top_on, light_bottom_on = BerbelBluetoothDeviceParser._parse_light_status(status)
-        fan_level = BerbelBluetoothDeviceParser._parse_fan_level(status)
-        fan_postrun_active = BerbelBluetoothDeviceParser._parse_postrun_status(status)
-        light_bottom_brightness, light_top_brightness = BerbelBluetoothDeviceParser._parse_brightness(brightness)
-        light_bottom_color, light_top_color = BerbelBluetoothDeviceParser._parse_colors(colors)
-
-        return {
-            "light_top_on": light_top_on,
-            "light_bottom_on": light_bottom_on,
-            "light_top_brightness": light_top_brightness,
-            "light_bottom_brightness": light_bottom_brightness,
-            "light_top_color": light_top_color,
-            "light_bottom_color": light_bottom_color,
-            "fan_level": fan_level,
-            "fan_postrun_active": fan_postrun_active,
-        }
-
-    @staticmethod
-    def create_device_from_data(name: str, address: str, data: dict) -> BerbelDevice:
-        """Creates a BerbelDevice from parsed data."""
-        return BerbelDevice(
-            name=name,
-            address=address,
-            **data
-        ) 
\ No newline at end of file
+    _parse_light_status = staticmethod(parse_light_status)
+    _parse_fan_level = staticmethod(parse_fan_level)
+    _parse_postrun_status = staticmethod(parse_postrun_status)
+    _parse_brightness = staticmethod(parse_brightness)
+    _parse_colors = staticmethod(parse_colors)
+    parse_status = staticmethod(parse_status)
+    create_device_from_data = staticmethod(create_device_from_data)
@@ -14,10 +14,12 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import BerbelDataUpdateCoordinator
-from .const import DOMAIN, SWITCH_POSTRUN_SUFFIX, MANUFACTURER
+from .const import SWITCH_POSTRUN_SUFFIX
 
 _LOGGER = logging.getLogger(__name__)
 
+POSTRUN_DESCRIPTION = "Zeigt an, ob der Lüfter-Nachlauf aktiv ist"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,7 +27,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Berbel Skyline Edge Base binary sensor platform."""
-    coordinator: BerbelDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: BerbelDataUpdateCoordinator = config_entry.runtime_data
     
     async_add_entities([BerbelPostrunBinarySensor(coordinator, config_entry)])
 
@@ -43,19 +45,16 @@ class BerbelPostrunBinarySensor(CoordinatorEntity[BerbelDataUpdateCoordinator],
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.data["address"])},
-            "name": config_entry.title or "Berbel Skyline Edge Base",
-            "manufacturer": MANUFACTURER,
-            "model": "Skyline Edge Base",
-            "sw_version": "0.1.0",
-        }
+        self._attr_device_info = coordinator.device_info
         
         self._attr_unique_id = f"{config_entry.data['address']}_postrun"
-        self._attr_name = f"{config_entry.title or 'Berbel'} {SWITCH_POSTRUN_SUFFIX}"
+        self._attr_name = f"{coordinator.device_name} {SWITCH_POSTRUN_SUFFIX}"
         self._attr_icon = "mdi:fan-clock"
         self._attr_entity_category = None
         self._attr_has_entity_name = True
+        # Attributes built for the current coordinator data, see extra_state_attributes
+        self._attrs_source: Any = None
+        self._attrs: dict[str, Any] = {}
 
     @property
     def is_on(self) -> bool:
@@ -65,14 +64,20 @@ class BerbelPostrunBinarySensor(CoordinatorEntity[BerbelDataUpdateCoordinator],
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return {}
-        return {
-            "fan_level": self.coordinator.data.fan_level,
-            "description": "Zeigt an, ob der Lüfter-Nachlauf aktiv ist",
-        }
+        # Reuse the dict until the coordinator delivers new data
+        if data is not self._attrs_source:
+            self._attrs = {
+                "fan_level": data.fan_level,
+                "description": POSTRUN_DESCRIPTION,
+            }
+            self._attrs_source = data
+        return self._attrs
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._attrs_source = None
         self.async_write_ha_state() 
\ No newline at end of file
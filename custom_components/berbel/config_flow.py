@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -13,8 +14,8 @@ from homeassistant.const import CONF_ADDRESS, CONF_NAME
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.device_registry import format_mac
 
-from .berbel_ble import BerbelBluetoothDeviceData
-from .const import DOMAIN, MANUFACTURER, SUPPORTED_MODELS
+from .berbel_ble import BerbelBluetoothDeviceData, BerbelDevice
+from .const import DOMAIN, MANUFACTURER, SUPPORTED_MODELS_RE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,21 +23,25 @@ _LOGGER = logging.getLogger(__name__)
 class BerbelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Berbel Skyline Edge Base."""
 
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovered_device: BluetoothServiceInfoBleak | None = None
+        # Keyed by format_mac(address), the form the unique ID uses
         self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
+        # User step schema and the discovered addresses it was built for
+        self._schema_cache: tuple[frozenset[str], vol.Schema] | None = None
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> FlowResult:
         """Handle the bluetooth discovery step."""
-        await self.async_set_unique_id(format_mac(discovery_info.address))
+        address = discovery_info.address
+        await self.async_set_unique_id(format_mac(address))
         self._abort_if_unique_id_configured()
 
-        device_name = discovery_info.name or discovery_info.address
+        device_name = discovery_info.name or address
         _LOGGER.debug("Discovered Berbel Skyline Edge Base device: %s", device_name)
 
         # Validate that this is a supported Berbel device
@@ -48,7 +53,7 @@ class BerbelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Set the title for the flow
         self.context["title_placeholders"] = {
             "name": device_name,
-            "address": discovery_info.address,
+            "address": address,
         }
 
         return await self.async_step_confirm()
@@ -58,53 +63,70 @@ class BerbelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle the user step to pick discovered device."""
         if user_input is not None:
-            address = user_input[CONF_ADDRESS]
-            await self.async_set_unique_id(format_mac(address))
+            address_mac = user_input[CONF_ADDRESS]
+            await self.async_set_unique_id(address_mac)
             self._abort_if_unique_id_configured()
-            discovery_info = self._discovered_devices[address]
+            discovery_info = self._discovered_devices[address_mac]
 
             # Try to connect to the device to validate it's working
             try:
-                await self._test_connection(discovery_info)
+                device = await self._test_connection(discovery_info)
             except Exception as err:
-                _LOGGER.exception("Unexpected exception during connection test")
+                _LOGGER.error("Connection test failed: %s", err)
                 return self.async_abort(reason="cannot_connect")
 
+            address = discovery_info.address
+            name = discovery_info.name or address
+            self._async_store_initial_device(address, device)
             return self.async_create_entry(
-                title=discovery_info.name or discovery_info.address,
+                title=name,
                 data={
-                    CONF_ADDRESS: discovery_info.address,
-                    CONF_NAME: discovery_info.name or discovery_info.address,
+                    CONF_ADDRESS: address.upper(),
+                    CONF_NAME: name,
                 },
             )
 
-        # Scan for devices
-        current_addresses = self._async_current_addresses()
+        # Scan for devices. Most advertisements come from unrelated devices, so
+        # the name check runs first; configured and already discovered
+        # addresses are then skipped with a single set lookup. All addresses are
+        # compared in format_mac form, whatever case the entries stored.
+        known = self._async_current_addresses()
+        known.update(self._discovered_devices)
         for discovery_info in bluetooth.async_discovered_service_info(self.hass):
-            if (
-                discovery_info.address in current_addresses
-                or discovery_info.address in self._discovered_devices
-                or not self._is_supported_device(discovery_info)
-            ):
+            if not self._is_supported_device(discovery_info):
                 continue
-            self._discovered_devices[discovery_info.address] = discovery_info
+            address_mac = format_mac(discovery_info.address)
+            if address_mac in known:
+                continue
+            known.add(address_mac)
+            self._discovered_devices[address_mac] = discovery_info
 
         if not self._discovered_devices:
             return self.async_abort(reason="no_devices_found")
 
+        return self.async_show_form(step_id="user", data_schema=self._user_schema())
+
+    def _user_schema(self) -> vol.Schema:
+        """Return the device picker schema, rebuilt only when the devices change."""
+        key = frozenset(self._discovered_devices)
+        cached = self._schema_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_ADDRESS): vol.In(
                     {
-                        service_info.address: (
+                        address_mac: (
                             f"{service_info.name or 'Unknown'} ({service_info.address})"
                         )
-                        for service_info in self._discovered_devices.values()
+                        for address_mac, service_info in self._discovered_devices.items()
                     }
                 ),
             }
         )
-        return self.async_show_form(step_id="user", data_schema=data_schema)
+        self._schema_cache = (key, data_schema)
+        return data_schema
 
     async def async_step_confirm(
         self, user_input: dict[str, Any] | None = None
@@ -113,43 +135,60 @@ class BerbelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is None:
             return self.async_show_form(step_id="confirm")
 
-        if self._discovered_device is None:
+        discovery_info = self._discovered_device
+        if discovery_info is None:
             return self.async_abort(reason="discovery_error")
 
         try:
-            await self._test_connection(self._discovered_device)
+            device = await self._test_connection(discovery_info)
         except Exception as err:
-            _LOGGER.exception("Unexpected exception during connection test")
+            _LOGGER.error("Connection test failed: %s", err)
             return self.async_abort(reason="cannot_connect")
 
+        address = discovery_info.address
+        name = discovery_info.name or address
+        self._async_store_initial_device(address, device)
         return self.async_create_entry(
-            title=self._discovered_device.name or self._discovered_device.address,
+            title=name,
             data={
-                CONF_ADDRESS: self._discovered_device.address,
-                CONF_NAME: self._discovered_device.name or self._discovered_device.address,
+                CONF_ADDRESS: address.upper(),
+                CONF_NAME: name,
             },
         )
 
     def _async_current_addresses(self) -> set[str]:
-        """Return a set of addresses that are already configured."""
+        """Return the already configured addresses in format_mac form."""
         return {
-            entry.data[CONF_ADDRESS]
+            format_mac(entry.data[CONF_ADDRESS])
             for entry in self._async_current_entries()
             if CONF_ADDRESS in entry.data
         }
 
     def _is_supported_device(self, discovery_info: BluetoothServiceInfoBleak) -> bool:
         """Check if the discovered device is a supported Berbel device."""
-        if discovery_info.name is None:
-            return False
+        return SUPPORTED_MODELS_RE.search(discovery_info.name or "") is not None
 
-        name_upper = discovery_info.name.upper()
-        return any(model in name_upper for model in SUPPORTED_MODELS)
+    def _async_store_initial_device(self, address: str, device: BerbelDevice | None) -> None:
+        """Hand the status read by the connection test to the entry setup.
 
-    async def _test_connection(self, discovery_info: BluetoothServiceInfoBleak) -> None:
+        async_setup_entry seeds the coordinator with it instead of connecting
+        and reading the same status again right away.
+        """
+        if device is None:
+            return
+        domain_data = self.hass.data.setdefault(DOMAIN, {})
+        domain_data.setdefault("_initial_devices", {})[address.upper()] = (
+            time.monotonic(),
+            device,
+        )
+
+    async def _test_connection(
+        self, discovery_info: BluetoothServiceInfoBleak
+    ) -> BerbelDevice | None:
         """Test the connection to the device.
         For legacy models (e.g., HOOD_PER), skip opening a GATT connection here and
         validate based on advertisement data to avoid exhausting BLE slots.
+        Returns the status read from modern models, None for legacy ones.
         """
         ble_device = discovery_info.device
         client = BerbelBluetoothDeviceData(_LOGGER)
@@ -162,7 +201,7 @@ class BerbelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 device = await client.update_device(ble_device)
                 _LOGGER.debug("Successfully connected to device: %s", device)
-                return
+                return device
             except BleakError as err:
                 _LOGGER.error("BLE connection failed: %s", err)
                 raise
@@ -171,13 +210,14 @@ class BerbelConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 raise
         else:
             # For legacy, ensure we have manufacturer data in the advertisement
-            mfd = ble_device.metadata.get("manufacturer_data") if hasattr(ble_device, "metadata") else None
+            metadata = getattr(ble_device, "metadata", None)
+            mfd = metadata.get("manufacturer_data") if metadata else None
             if isinstance(mfd, dict) and mfd:
                 _LOGGER.debug("Legacy device detected; manufacturer data present. Skipping GATT connect test.")
-                return
+                return None
             # If no manufacturer data, we still avoid connecting; log a warning.
             _LOGGER.warning(
                 "Legacy device detected but no manufacturer data present in discovery. "
                 "Proceeding without active connection test."
             )
-            return
+            return None
@@ -1,6 +1,7 @@
 """Constants for the Berbel Skyline Edge Base integration."""
 from __future__ import annotations
 
+import re
 from typing import Final
 
 # Integration domain
@@ -12,8 +13,16 @@ UPDATE_INTERVAL: Final = 18
 # Device manufacturer
 MANUFACTURER: Final = "Berbel"
 
+# Device registry model and fallback name for entries without a title
+MODEL: Final = "Skyline Edge Base"
+DEFAULT_NAME: Final = "Berbel Skyline Edge Base"
+
 # Supported device models (primary target: Skyline Edge Base)
 SUPPORTED_MODELS: Final = ["SKE", "BERBEL", "HOOD_PER"]
+# Matches an advertised name containing any supported model (case-insensitive)
+SUPPORTED_MODELS_RE: Final = re.compile(
+    "|".join(re.escape(model) for model in SUPPORTED_MODELS), re.IGNORECASE
+)
 
 # Entity suffixes
 FAN_SUFFIX: Final = "Fan"
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
 from datetime import timedelta
 from typing import Any
@@ -13,7 +14,9 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .berbel_ble import BerbelBluetoothDeviceData, BerbelDevice
-from .const import DOMAIN, UPDATE_INTERVAL
+from .berbel_ble.const import MAX_KELVIN, MIN_KELVIN
+from .berbel_ble.models import kelvin_to_color_percentage
+from .const import DEFAULT_NAME, DOMAIN, MANUFACTURER, MODEL, UPDATE_INTERVAL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,21 +29,49 @@ class BerbelDataUpdateCoordinator(DataUpdateCoordinator[BerbelDevice]):
         hass: HomeAssistant,
         device: BLEDevice,
         name: str,
+        initial_data: BerbelDevice | None = None,
+        *,
+        address: str | None = None,
     ) -> None:
-        """Initialize the coordinator."""
+        """Initialize the coordinator.
+
+        initial_data, if given, is a status read moments ago (by the config
+        flow) and replaces the first refresh. address is the one stored in
+        the config entry (defaults to the BLE device's) and identifies the
+        device in the registry.
+        """
+        # Shared by all entities of the device; the name prefixes their names
+        self.device_name = name or DEFAULT_NAME
         super().__init__(
             hass,
             _LOGGER,
-            name=f"{DOMAIN}_{name}",
+            name=f"{DOMAIN}_{self.device_name}",
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # BerbelDevice is a dataclass and compares by value, so polls
+            # that return an unchanged status do not notify the entities
+            always_update=False,
         )
         self.ble_device = device
         self.client = BerbelBluetoothDeviceData(_LOGGER)
-        self._connection_lock = asyncio.Lock()
+        self.device_info = {
+            "identifiers": {(DOMAIN, address or device.address)},
+            "name": self.device_name,
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+            "sw_version": "0.1.0",
+        }
+        self._client_has_disconnect = hasattr(self.client, "disconnect")
+        # Queued commands by kind, run by the drain task, see _execute_command_optimized
+        self._pending_commands: dict[
+            str, tuple[Any, tuple, dict, dict[str, Any] | None, list[asyncio.Future]]
+        ] = {}
+        self._command_task: asyncio.Task | None = None
         self._immediate_refresh = True  # Controls immediate status updates after commands
         self._consecutive_failures = 0
         self._max_consecutive_failures = 3  # Maximum 3 consecutive failures
-        _LOGGER.info("Initializing Berbel coordinator for device %s (%s)", name, device.address)
+        _LOGGER.info("Initializing Berbel coordinator for device %s (%s)", self.device_name, device.address)
+        if initial_data is not None:
+            self.async_set_updated_data(initial_data)
 
     async def _async_update_data(self) -> BerbelDevice:
         """Update data via library."""
@@ -48,76 +79,135 @@ class BerbelDataUpdateCoordinator(DataUpdateCoordinator[BerbelDevice]):
         try:
             # Use separate lock for updates to avoid deadlocks
             device_data = await self.client.update_device(self.ble_device)
+        except Exception as err:
+            return self._handle_update_failure(err)
+
+        # Runs on every poll; skip the argument lookups unless debugging
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Updated device data: %s", device_data)
-            _LOGGER.info("Successfully updated data for %s: Fan=%d, Top Light=%s, Bottom Light=%s", 
+            _LOGGER.debug("Successfully updated data for %s: Fan=%d, Top Light=%s, Bottom Light=%s", 
                        self.ble_device.address, device_data.fan_level, 
                        device_data.light_top_on, device_data.light_bottom_on)
-            
-            # Reset failure counter on successful update
-            self._consecutive_failures = 0
-            return device_data
-            
-        except BleakError as err:
-            self._consecutive_failures += 1
+
+        # Reset failure counter on successful update
+        self._consecutive_failures = 0
+        return device_data
+
+    def _handle_update_failure(self, err: Exception) -> BerbelDevice:
+        """Count a failed update and keep the previous data or raise UpdateFailed."""
+        self._consecutive_failures += 1
+        is_ble_error = isinstance(err, BleakError)
+        if is_ble_error:
             _LOGGER.warning("BLE connection failed for %s (failure %d/%d): %s", 
                           self.ble_device.address, self._consecutive_failures, 
                           self._max_consecutive_failures, err)
-            
-            # Only treat as UpdateFailed when too many consecutive failures
-            if self._consecutive_failures >= self._max_consecutive_failures:
-                _LOGGER.error("Too many consecutive failures for %s, marking as unavailable", 
-                            self.ble_device.address)
-                raise UpdateFailed(f"Device unavailable after {self._consecutive_failures} failures: {err}") from err
-            
-            # For few failures: keep old data and warn
-            if self.data is not None:
-                _LOGGER.warning("Keeping previous data for %s due to temporary BLE error", 
-                              self.ble_device.address)
-                return self.data
-            else:
-                raise UpdateFailed(f"Initial connection failed: {err}") from err
-                
-        except Exception as err:
-            self._consecutive_failures += 1
+        else:
             _LOGGER.exception("Unexpected error fetching device data for %s (failure %d/%d)", 
                             self.ble_device.address, self._consecutive_failures, 
                             self._max_consecutive_failures)
-            
-            # Only treat as UpdateFailed when too many consecutive failures
-            if self._consecutive_failures >= self._max_consecutive_failures:
-                _LOGGER.error("Too many consecutive failures for %s, marking as unavailable", 
-                            self.ble_device.address)
-                raise UpdateFailed(f"Device unavailable after {self._consecutive_failures} failures: {err}") from err
-            
-            # For few failures: keep old data and warn
-            if self.data is not None:
-                _LOGGER.warning("Keeping previous data for %s due to temporary error", 
-                              self.ble_device.address)
-                return self.data
-            else:
-                raise UpdateFailed(f"Initial connection failed: {err}") from err
-
-    async def _execute_command_optimized(self, command_func, *args, **kwargs) -> None:
-        """Executes a command and triggers status update only when needed."""
-        try:
-            _LOGGER.debug("Coordinator: Executing optimized command...")
-            async with self._connection_lock:
-                await command_func(*args, **kwargs)
-                _LOGGER.debug("Coordinator: Command executed successfully")
-            
-            # Trigger immediate update only when needed
-            if self._immediate_refresh:
-                _LOGGER.debug("Coordinator: Triggering immediate update...")
-                await self.async_request_refresh()
-            else:
-                _LOGGER.debug("Coordinator: Skipping immediate update, waiting for next scheduled update")
-                
-        except BleakError as err:
-            _LOGGER.error("Failed to execute command for %s: %s", self.ble_device.address, err)
-            raise
-        except Exception as err:
-            _LOGGER.exception("Unexpected error executing command for %s", self.ble_device.address)
-            raise
+
+        # Only treat as UpdateFailed when too many consecutive failures
+        if self._consecutive_failures >= self._max_consecutive_failures:
+            _LOGGER.error("Too many consecutive failures for %s, marking as unavailable", 
+                        self.ble_device.address)
+            raise UpdateFailed(f"Device unavailable after {self._consecutive_failures} failures: {err}") from err
+
+        # For few failures: keep old data and warn
+        if self.data is not None:
+            _LOGGER.warning("Keeping previous data for %s due to temporary %s", 
+                          self.ble_device.address, "BLE error" if is_ble_error else "error")
+            return self.data
+        raise UpdateFailed(f"Initial connection failed: {err}") from err
+
+    async def _execute_command_optimized(
+        self, command_func, *args, optimistic: dict[str, Any] | None = None, **kwargs
+    ) -> None:
+        """Queues a command and waits until it, or a newer one of its kind, ran.
+
+        Commands are keyed by kind (the client method plus the names of the
+        keyword arguments, which select the fields it writes). A command
+        that is still queued is replaced by a newer one of the same kind, so
+        e.g. a brightness slider drag ends up as one BLE write per light.
+        The replaced command's callers wait for the newer one.
+
+        optimistic holds BerbelDevice fields the command sets; they are
+        published once it succeeded, before its callers resume and before
+        the refresh that follows.
+        """
+        kind = command_func.__name__
+        if kwargs:
+            kind = f"{kind}:{','.join(sorted(kwargs))}"
+        # Re-insert at the end so the queue keeps the order of the latest calls
+        previous = self._pending_commands.pop(kind, None)
+        waiters = previous[4] if previous is not None else []
+        if previous is not None:
+            _LOGGER.debug("Coordinator: Replacing queued %s command", kind)
+        future = self.hass.loop.create_future()
+        waiters.append(future)
+        self._pending_commands[kind] = (command_func, args, kwargs, optimistic, waiters)
+        if self._command_task is None or self._command_task.done():
+            self._command_task = self.hass.async_create_background_task(
+                self._async_drain_commands(), f"{self.name} commands"
+            )
+        await future
+
+    async def _async_drain_commands(self) -> None:
+        """Runs queued commands one at a time until the queue is empty."""
+        while self._pending_commands:
+            batch = self._pending_commands
+            self._pending_commands = {}
+            results: list[tuple[list[asyncio.Future], BaseException | None]] = []
+            try:
+                for command_func, args, kwargs, optimistic, waiters in batch.values():
+                    _LOGGER.debug("Coordinator: Executing optimized command...")
+                    try:
+                        await command_func(*args, **kwargs)
+                    except BleakError as err:
+                        _LOGGER.error("Failed to execute command for %s: %s", self.ble_device.address, err)
+                        results.append((waiters, err))
+                    except Exception as err:
+                        _LOGGER.exception("Unexpected error executing command for %s", self.ble_device.address)
+                        results.append((waiters, err))
+                    else:
+                        _LOGGER.debug("Coordinator: Command executed successfully")
+                        if optimistic and self.data is not None:
+                            # Publish the written state without waiting for a status read
+                            self.async_set_updated_data(dataclasses.replace(self.data, **optimistic))
+                        results.append((waiters, None))
+            finally:
+                done = len(results)
+                for waiters, err in results:
+                    for future in waiters:
+                        if future.done():
+                            continue
+                        if err is None:
+                            future.set_result(None)
+                        else:
+                            future.set_exception(err)
+                # Only reached with leftovers if the task was cancelled
+                for *_, waiters in list(batch.values())[done:]:
+                    for future in waiters:
+                        future.cancel()
+
+            # One refresh per batch; a burst of commands shares the refresh
+            # that is already pending. It runs after the optimistic state was
+            # published, so the real status read wins.
+            if any(err is None for _, err in results):
+                try:
+                    await self._async_refresh_after_commands()
+                except Exception:
+                    # Keep draining; commands queued meanwhile must still run
+                    _LOGGER.exception("Refresh after commands failed for %s", self.ble_device.address)
+
+    async def _async_refresh_after_commands(self) -> None:
+        """Triggers a status update after commands only when needed."""
+        if self._immediate_refresh:
+            _LOGGER.debug("Coordinator: Triggering immediate update...")
+            # The request debouncer already folds refreshes that come in
+            # while one is running into a single follow-up
+            await self.async_request_refresh()
+        else:
+            _LOGGER.debug("Coordinator: Skipping immediate update, waiting for next scheduled update")
 
     async def async_set_fan_level(self, level: int) -> None:
         """Set fan level."""
@@ -181,15 +271,11 @@ class BerbelDataUpdateCoordinator(DataUpdateCoordinator[BerbelDevice]):
                         self.client.turn_both_lights_off, self.ble_device
                     )
                 else:
-                    # Mixed state - handle individually
-                    if top_on is not None:
-                        await self._execute_command_optimized(
-                            self.client.set_light_top_on, self.ble_device, top_on
-                        )
-                    if bottom_on is not None:
-                        await self._execute_command_optimized(
-                            self.client.set_light_bottom_on, self.ble_device, bottom_on
-                        )
+                    # Mixed state - one brightness write covers both lights
+                    await self._execute_command_optimized(
+                        self.client.set_both_lights_brightness, self.ble_device,
+                        100 if top_on else 0, 100 if bottom_on else 0,
+                    )
             elif top_on is not None:
                 await self._execute_command_optimized(
                     self.client.set_light_top_on, self.ble_device, top_on
@@ -229,13 +315,69 @@ class BerbelDataUpdateCoordinator(DataUpdateCoordinator[BerbelDevice]):
             _LOGGER.error("Failed to set light color temperature: %s", err)
             raise
 
+    async def async_apply_light_state(
+        self,
+        position: str,
+        *,
+        on: bool | None = None,
+        brightness: int | None = None,
+        kelvin: int | None = None,
+    ) -> None:
+        """Set on/off, brightness and color temperature of one light at once.
+
+        brightness (0-100%) takes precedence over on; switching on without a
+        brightness writes 100%. All given values go out as one queued
+        set_light_state call, i.e. one connection and lock acquire, and are
+        published to the listeners as soon as it succeeded; the next status
+        read corrects any rounding the device applied.
+        """
+        if position not in ("top", "bottom"):
+            raise ValueError("Position must be 'top' or 'bottom'")
+        if brightness is None and on is not None:
+            brightness = 100 if on else 0
+
+        values: dict[str, int] = {}
+        optimistic: dict[str, Any] = {}
+        if brightness is not None:
+            if not 0 <= brightness <= 100:
+                raise ValueError("Brightness must be between 0 and 100")
+            values[f"{position}_brightness"] = brightness
+            optimistic[f"light_{position}_on"] = brightness > 0
+            optimistic[f"light_{position}_brightness"] = brightness
+        if kelvin is not None:
+            if not MIN_KELVIN <= kelvin <= MAX_KELVIN:
+                raise ValueError(f"Kelvin must be between {MIN_KELVIN} and {MAX_KELVIN}")
+            values[f"{position}_color"] = kelvin_to_color_percentage(int(kelvin))
+            optimistic[f"light_{position}_color"] = values[f"{position}_color"]
+        if not values:
+            return
+
+        _LOGGER.info("Setting %s light - brightness: %s, color temp: %s K for device %s",
+                    position, brightness, kelvin, self.ble_device.address)
+        try:
+            await self._execute_command_optimized(
+                self.client.set_light_state, self.ble_device, optimistic=optimistic, **values
+            )
+            _LOGGER.info("Successfully set %s light state", position)
+        except Exception as err:
+            _LOGGER.error("Failed to set %s light state: %s", position, err)
+            raise
+
     def set_immediate_refresh(self, enabled: bool) -> None:
         """Enables or disables immediate status updates after commands."""
+        if self._immediate_refresh == enabled:
+            return
         self._immediate_refresh = enabled
         _LOGGER.info("Immediate refresh %s", "enabled" if enabled else "disabled")
 
     async def async_cleanup(self) -> None:
         """Cleanup coordinator resources."""
-        if hasattr(self.client, 'disconnect'):
+        if self._command_task is not None and not self._command_task.done():
+            self._command_task.cancel()
+        for *_, waiters in self._pending_commands.values():
+            for future in waiters:
+                future.cancel()
+        self._pending_commands.clear()
+        if self._client_has_disconnect:
             await self.client.disconnect()
         _LOGGER.info("Coordinator cleanup completed") 
\ No newline at end of file
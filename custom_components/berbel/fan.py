@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
@@ -16,12 +16,31 @@ from homeassistant.util.percentage import (
 )
 
 from .coordinator import BerbelDataUpdateCoordinator
-from .const import DOMAIN, FAN_SUFFIX, MANUFACTURER, ATTR_FAN_POSTRUN
+from .const import FAN_SUFFIX, ATTR_FAN_POSTRUN
 
 _LOGGER = logging.getLogger(__name__)
 
 # Fan speed levels (0-3) to percentage mapping
-SPEED_RANGE = (1, 3)  # Berbel fan has 3 speed levels
+SPEED_RANGE: Final[tuple[int, int]] = (1, 3)  # Berbel fan has 3 speed levels
+
+_SUPPORTED_FEATURES: Final = (
+    FanEntityFeature.SET_SPEED | FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
+)
+
+
+def _level_for_percentage(percentage: int) -> int:
+    """Convert a speed percentage to a fan level (0 = off)."""
+    if percentage == 0:
+        return 0
+    return max(1, int(percentage_to_ranged_value(SPEED_RANGE, percentage)))
+
+
+# Precomputed conversions; the parser reports levels up to 4
+_LEVEL_TO_PCT = (0,) + tuple(
+    ranged_value_to_percentage(SPEED_RANGE, level) for level in range(1, 5)
+)
+# Percentages HA sends for the speed steps, mapped with the same formula
+_PCT_TO_LEVEL = {pct: _level_for_percentage(pct) for pct in _LEVEL_TO_PCT}
 
 
 async def async_setup_entry(
@@ -30,7 +49,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Berbel Skyline Edge Base fan platform."""
-    coordinator: BerbelDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: BerbelDataUpdateCoordinator = config_entry.runtime_data
     
     async_add_entities([BerbelFan(coordinator, config_entry)])
 
@@ -38,7 +57,7 @@ async def async_setup_entry(
 class BerbelFan(CoordinatorEntity[BerbelDataUpdateCoordinator], FanEntity):
     """Representation of a Berbel Skyline Edge Base fan."""
 
-    _attr_supported_features = FanEntityFeature.SET_SPEED | FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
+    _attr_supported_features = _SUPPORTED_FEATURES
     _attr_speed_count = 3
 
     def __init__(
@@ -49,49 +68,54 @@ class BerbelFan(CoordinatorEntity[BerbelDataUpdateCoordinator], FanEntity):
         """Initialize the fan."""
         super().__init__(coordinator)
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.data["address"])},
-            "name": config_entry.title or "Berbel Skyline Edge Base",
-            "manufacturer": MANUFACTURER,
-            "model": "Skyline Edge Base",
-            "sw_version": "0.1.0",
-        }
+        self._attr_device_info = coordinator.device_info
         
         self._attr_unique_id = f"{config_entry.data['address']}_fan"
-        self._attr_name = f"{config_entry.title or 'Berbel'} {FAN_SUFFIX}"
+        self._attr_name = f"{coordinator.device_name} {FAN_SUFFIX}"
         
         # Ensure this entity is recognized as a fan
         self._attr_entity_category = None
         self._attr_has_entity_name = True
+        # Last attributes dict and the (postrun, level) values it was built from
+        self._attrs_cache: dict[str, Any] = {}
+        self._attrs_cache_key: tuple[bool, int] | None = None
 
     @property
     def is_on(self) -> bool:
         """Return true if fan is on."""
-        return self.coordinator.data is not None and self.coordinator.data.fan_level > 0
+        data = self.coordinator.data
+        return data is not None and data.fan_level > 0
 
     @property
     def percentage(self) -> int | None:
         """Return the current speed percentage."""
-        if self.coordinator.data is None or self.coordinator.data.fan_level == 0:
+        data = self.coordinator.data
+        if data is None:
             return 0
-        return ranged_value_to_percentage(SPEED_RANGE, self.coordinator.data.fan_level)
+        return _LEVEL_TO_PCT[data.fan_level]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return {}
-        return {
-            ATTR_FAN_POSTRUN: self.coordinator.data.fan_postrun_active,
-            "fan_level": self.coordinator.data.fan_level,
-        }
+        postrun = data.fan_postrun_active
+        level = data.fan_level
+        key = (postrun, level)
+        if key != self._attrs_cache_key:
+            self._attrs_cache = {
+                ATTR_FAN_POSTRUN: postrun,
+                "fan_level": level,
+            }
+            self._attrs_cache_key = key
+        return self._attrs_cache
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
-        if percentage == 0:
-            level = 0
-        else:
-            level = max(1, int(percentage_to_ranged_value(SPEED_RANGE, percentage)))
+        level = _PCT_TO_LEVEL.get(percentage)
+        if level is None:
+            level = _level_for_percentage(percentage)
         
         _LOGGER.debug("Setting fan level to %d (from percentage %d)", level, percentage)
         
@@ -16,23 +16,40 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util.color import (
-    color_temperature_kelvin_to_mired,
-    color_temperature_mired_to_kelvin,
-)
 
 from .coordinator import BerbelDataUpdateCoordinator
 from .const import (
-    DOMAIN,
     LIGHT_TOP_SUFFIX,
     LIGHT_BOTTOM_SUFFIX,
-    MANUFACTURER,
     ATTR_COLOR_TEMP_KELVIN,
 )
 from .berbel_ble.const import MIN_KELVIN, MAX_KELVIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Brightness conversions between the device's 0-100% and HA's 0-255,
+# precomputed with the truncating formulas used before
+_PCT_TO_255 = tuple(int(pct * 255 / 100) for pct in range(101))
+_255_TO_PCT = tuple(int(value * 100 / 255) for value in range(256))
+
+# Mired range of the lights; 1_000_000 // x converts either way and matches
+# HA's color util (floor(1e6 / x)) for integer values
+_MIN_MIREDS = 1_000_000 // MAX_KELVIN
+_MAX_MIREDS = 1_000_000 // MIN_KELVIN
+
+# Per position: (name suffix, BerbelDevice fields for on, brightness, color
+# and color in Kelvin)
+POSITION_SPEC: dict[str, tuple[str, str, str, str, str]] = {
+    position: (
+        suffix,
+        f"light_{position}_on",
+        f"light_{position}_brightness",
+        f"light_{position}_color",
+        f"light_{position}_color_kelvin",
+    )
+    for position, suffix in (("top", LIGHT_TOP_SUFFIX), ("bottom", LIGHT_BOTTOM_SUFFIX))
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -40,11 +57,11 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Berbel Skyline Edge Base light platform."""
-    coordinator: BerbelDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    
+    coordinator: BerbelDataUpdateCoordinator = config_entry.runtime_data
+
     async_add_entities([
-        BerbelLight(coordinator, config_entry, "top"),
-        BerbelLight(coordinator, config_entry, "bottom"),
+        BerbelLight(coordinator, config_entry, position)
+        for position in POSITION_SPEC
     ])
 
 
@@ -53,8 +70,8 @@ class BerbelLight(CoordinatorEntity[BerbelDataUpdateCoordinator], LightEntity):
 
     _attr_supported_color_modes = {ColorMode.COLOR_TEMP}
     _attr_color_mode = ColorMode.COLOR_TEMP
-    _attr_min_mireds = color_temperature_kelvin_to_mired(MAX_KELVIN)
-    _attr_max_mireds = color_temperature_kelvin_to_mired(MIN_KELVIN)
+    _attr_min_mireds = _MIN_MIREDS
+    _attr_max_mireds = _MAX_MIREDS
 
     def __init__(
         self,
@@ -63,109 +80,111 @@ class BerbelLight(CoordinatorEntity[BerbelDataUpdateCoordinator], LightEntity):
         position: str,
     ) -> None:
         """Initialize the light."""
-        super().__init__(coordinator)
+        # The position is registered as listener context, see
+        # DataUpdateCoordinator.async_contexts
+        super().__init__(coordinator, context=position)
         
         self.position = position
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.data["address"])},
-            "name": config_entry.title or "Berbel Skyline Edge Base",
-            "manufacturer": MANUFACTURER,
-            "model": "Skyline Edge Base",
-            "sw_version": "0.1.0",
-        }
-        
-        position_suffix = LIGHT_TOP_SUFFIX if position == "top" else LIGHT_BOTTOM_SUFFIX
+        # Shared by all entities of the device, see the coordinator
+        self._attr_device_info = coordinator.device_info
+
+        # BerbelDevice fields of this light, fixed for the entity's lifetime
+        (
+            position_suffix,
+            self._on_attr,
+            self._brightness_attr,
+            self._color_attr,
+            self._kelvin_attr,
+        ) = POSITION_SPEC[position]
         self._attr_unique_id = f"{config_entry.data['address']}_light_{position}"
-        self._attr_name = f"{config_entry.title or 'Berbel'} {position_suffix}"
+        self._attr_name = f"{coordinator.device_name} {position_suffix}"
+        # State derived from the coordinator data, refreshed on every update
+        self._cached_is_on = False
+        self._cached_brightness: int | None = None
+        self._cached_mireds: int | None = None
+        self._cached_attrs: dict[str, Any] = {}
+        # (availability, on, brightness, color) the cached state was derived from
+        self._last_state_key: tuple | None = None
+        self._update_cached_state()
+
+    def _update_cached_state(self) -> bool:
+        """Derive the values HA reads from the current coordinator data.
+
+        Returns False if nothing this light exposes changed since the last call.
+        """
+        data = self.coordinator.data
+        if data is None:
+            key: tuple = (self.coordinator.last_update_success, None)
+        else:
+            key = (
+                self.coordinator.last_update_success,
+                getattr(data, self._on_attr),
+                getattr(data, self._brightness_attr),
+                getattr(data, self._color_attr),
+            )
+        if key == self._last_state_key:
+            return False
+        self._last_state_key = key
+        if data is None:
+            return True
+        self._cached_is_on = key[1]
+        # Convert from 0-100% to 0-255
+        self._cached_brightness = _PCT_TO_255[key[2]]
+        kelvin = getattr(data, self._kelvin_attr)
+        self._cached_mireds = 1_000_000 // kelvin
+        self._cached_attrs = {
+            ATTR_COLOR_TEMP_KELVIN: kelvin,
+            "brightness_percent": key[2],
+        }
+        return True
 
     @property
     def is_on(self) -> bool:
         """Return true if light is on."""
-        if self.position == "top":
-            return self.coordinator.data.light_top_on
-        return self.coordinator.data.light_bottom_on
+        return self._cached_is_on
 
     @property
     def brightness(self) -> int | None:
         """Return the brightness of this light between 0..255."""
-        if self.position == "top":
-            brightness_percent = self.coordinator.data.light_top_brightness
-        else:
-            brightness_percent = self.coordinator.data.light_bottom_brightness
-        
-        # Convert from 0-100% to 0-255
-        return int(brightness_percent * 255 / 100) if brightness_percent > 0 else 0
+        return self._cached_brightness
 
     @property
     def color_temp(self) -> int | None:
         """Return the CT color value in mireds."""
-        if self.position == "top":
-            kelvin = self.coordinator.data.light_top_color_kelvin
-        else:
-            kelvin = self.coordinator.data.light_bottom_color_kelvin
-        
-        return color_temperature_kelvin_to_mired(kelvin)
+        return self._cached_mireds
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        if self.position == "top":
-            kelvin = self.coordinator.data.light_top_color_kelvin
-            brightness = self.coordinator.data.light_top_brightness
-        else:
-            kelvin = self.coordinator.data.light_bottom_color_kelvin
-            brightness = self.coordinator.data.light_bottom_brightness
-
-        return {
-            ATTR_COLOR_TEMP_KELVIN: kelvin,
-            "brightness_percent": brightness,
-        }
+        return self._cached_attrs
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Instruct the light to turn on."""
         brightness = kwargs.get(ATTR_BRIGHTNESS)
         color_temp = kwargs.get(ATTR_COLOR_TEMP)
-        
-        try:
-            # Handle brightness
+
+        if brightness is None and color_temp is None and self.is_on:
+            # Bare turn_on of a light that is already on (e.g. scene refresh)
+            _LOGGER.debug("%s light is already on, nothing to send", self.position)
+            return
+
+        if brightness is not None:
+            # Convert from 0-255 to 0-100%
+            brightness_percent = _255_TO_PCT[brightness]
+        elif color_temp is not None and self.is_on:
+            # Only the color changes, keep the current brightness
             brightness_percent = None
-            if brightness is not None:
-                # Convert from 0-255 to 0-100%
-                brightness_percent = int(brightness * 100 / 255)
-            elif not self.is_on:
-                # If light is off and no brightness specified, use 100%
-                brightness_percent = 100
-
-            # Handle color temperature
-            kelvin = None
-            if color_temp is not None:
-                kelvin = color_temperature_mired_to_kelvin(color_temp)
-
-            # Set brightness first if specified
-            if brightness_percent is not None:
-                if self.position == "top":
-                    await self.coordinator.async_set_light_brightness(
-                        top_brightness=brightness_percent
-                    )
-                else:
-                    await self.coordinator.async_set_light_brightness(
-                        bottom_brightness=brightness_percent
-                    )
-
-            # Set color temperature if specified
-            if kelvin is not None:
-                if self.position == "top":
-                    await self.coordinator.async_set_light_color_temp(top_kelvin=kelvin)
-                else:
-                    await self.coordinator.async_set_light_color_temp(bottom_kelvin=kelvin)
-
-            # If only turning on without specific brightness, just turn on
-            if brightness_percent is None and color_temp is None:
-                if self.position == "top":
-                    await self.coordinator.async_set_light_on_off(top_on=True)
-                else:
-                    await self.coordinator.async_set_light_on_off(bottom_on=True)
+        else:
+            # Switching on writes full brightness
+            brightness_percent = 100
+        # Mireds and Kelvin convert into each other the same way
+        kelvin = 1_000_000 // color_temp if color_temp is not None else None
 
+        try:
+            # Brightness and color go out in one command
+            await self.coordinator.async_apply_light_state(
+                self.position, brightness=brightness_percent, kelvin=kelvin
+            )
         except Exception as err:
             _LOGGER.error("Error turning on %s light: %s", self.position, err)
             raise HomeAssistantError(
@@ -175,10 +194,7 @@ class BerbelLight(CoordinatorEntity[BerbelDataUpdateCoordinator], LightEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Instruct the light to turn off."""
         try:
-            if self.position == "top":
-                await self.coordinator.async_set_light_on_off(top_on=False)
-            else:
-                await self.coordinator.async_set_light_on_off(bottom_on=False)
+            await self.coordinator.async_apply_light_state(self.position, on=False)
         except Exception as err:
             _LOGGER.error("Error turning off %s light: %s", self.position, err)
             raise HomeAssistantError(
@@ -188,4 +204,11 @@ class BerbelLight(CoordinatorEntity[BerbelDataUpdateCoordinator], LightEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state() 
\ No newline at end of file
+        # Log instead of raising, so a bad value only affects this entity
+        # and the other listeners of the coordinator still get the update
+        try:
+            # Updates that only concern the other light (or the fan) are skipped
+            if self._update_cached_state():
+                self.async_write_ha_state()
+        except Exception:
+            _LOGGER.exception("Error handling update for %s", self.entity_id) 
\ No newline at end of file